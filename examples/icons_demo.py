@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright © QtAppUtils Project Contributors
+# https://github.com/geo-stack/qtapputils
+#
+# This file is part of QtAppUtils.
+# Licensed under the terms of the MIT License.
+# -----------------------------------------------------------------------------
+
+"""
+A demo of the IconManager.
+
+Running this script also saves the images of the icons that are used
+as references in 'qtapputils/tests/test_icons.py'.
+"""
+
+# ---- Standard imports
+import sys
+import os.path as osp
+
+# ---- Third party imports
+from qtpy.QtWidgets import QWidget, QHBoxLayout
+
+# ---- Local imports
+import qtapputils
+from qtapputils.icons import IconManager
+from qtapputils.qthelpers import create_toolbutton, create_qapplication
+from qtapputils.colors import RED, YELLOW, GREEN
+
+TESTS_DIR = osp.join(osp.dirname(qtapputils.__file__), 'tests')
+
+
+if __name__ == '__main__':
+    app = create_qapplication()
+
+    ICOM = IconManager(
+        qta_icons={
+            'alert': [
+                ('mdi.alert-outline',),
+                {'color': GREEN}],
+            'home': [
+                ('mdi.home',),
+                {'scale_factor': 1.3}],
+            'save': [
+                ('mdi.content-save',),
+                {'color': RED, 'scale_factor': 1.2}],
+            }
+        )
+
+    window = QWidget()
+
+    icon1 = ICOM.get_icon('home')
+    icon2 = ICOM.get_icon('save')
+    icon3 = ICOM.get_icon('save', color=YELLOW)
+    icon4 = ICOM.get_icon('save', color='#FF007F')
+    icon5 = ICOM.get_icon('alert')
+
+    icon1.pixmap(48).save(
+        osp.join(TESTS_DIR, 'home_icon.tiff'), 'TIFF')
+    icon2.pixmap(48).save(
+        osp.join(TESTS_DIR, 'red_save_icon.tiff'), 'TIFF')
+    icon3.pixmap(48).save(
+        osp.join(TESTS_DIR, 'yellow_save_icon.tiff'), 'TIFF')
+    icon4.pixmap(48).save(
+        osp.join(TESTS_DIR, 'pink_save_icon.tiff'), 'TIFF')
+    icon5.pixmap(48).save(
+        osp.join(TESTS_DIR, 'alert_icon.tiff'), 'TIFF')
+
+    layout = QHBoxLayout(window)
+    layout.addWidget(create_toolbutton(
+        window,
+        icon=icon1,
+        iconsize=ICOM.get_iconsize('large')
+        ))
+    layout.addWidget(create_toolbutton(
+        window,
+        icon=icon2,
+        iconsize=ICOM.get_iconsize('small')))
+    layout.addWidget(create_toolbutton(
+        window,
+        icon=icon3,
+        iconsize=ICOM.get_iconsize('normal')))
+
+    window.show()
+
+    sys.exit(app.exec_())
@@ -8,16 +8,17 @@
 # -----------------------------------------------------------------------------
 
 # ---- Standard imports
-from copy import deepcopy
+from functools import lru_cache
+import itertools
 
 # ---- Third party imports
 from qtpy.QtCore import QSize
-from qtpy.QtGui import QIcon
+from qtpy.QtGui import QIcon, QPixmap, QPixmapCache
 from qtpy.QtWidgets import QStyle, QApplication
-import qtawesome as qta
 
 # ---- Local imports
 from qtapputils.colors import CSS4_COLORS, DEFAULT_ICON_COLOR
+from qtapputils.qthelpers import clear_contents_margins_cache
 
 
 DEFAULT_ICON_SIZES = {
@@ -27,6 +28,30 @@ DEFAULT_ICON_SIZES = {
     }
 
 
+# The QStyle pixel metrics corresponding to the standard icon sizes.
+STANDARD_ICONSIZE_METRICS = {
+    'messagebox': QStyle.PM_MessageBoxIconSize,
+    'small': QStyle.PM_SmallIconSize,
+    'large': QStyle.PM_LargeIconSize,
+    'toolbar': QStyle.PM_ToolBarIconSize,
+    'button': QStyle.PM_ButtonIconSize,
+    }
+
+# A cache of the standard icon sizes that were already resolved.
+_STANDARD_ICONSIZES: dict[str, int] = {}
+
+# A counter used to give each IconManager a token for the keys of the
+# pixmaps it stores in the QPixmapCache. Unlike 'id', the tokens are never
+# reused when a manager is garbage collected.
+_ICON_MANAGER_TOKENS = itertools.count()
+
+
+@lru_cache(maxsize=None)
+def _get_style_constant(constant: str) -> int:
+    """Return the QStyle enum value corresponding to 'constant'."""
+    return getattr(QStyle, constant)
+
+
 def get_standard_icon(constant: str) -> QIcon:
     """
     Return a QIcon of a standard pixmap.
@@ -34,9 +59,8 @@ def get_standard_icon(constant: str) -> QIcon:
     See the link below for a list of valid constants:
     https://srinikom.github.io/pyside-docs/PySide/QtGui/QStyle.html
     """
-    constant = getattr(QStyle, constant)
     style = QApplication.instance().style()
-    return style.standardIcon(constant)
+    return style.standardIcon(_get_style_constant(constant))
 
 
 def get_standard_iconsize(constant: 'str') -> int:
@@ -45,17 +69,28 @@ def get_standard_iconsize(constant: 'str') -> int:
 
     https://srinikom.github.io/pyside-docs/PySide/QtGui/QStyle
     """
-    style = QApplication.instance().style()
-    if constant == 'messagebox':
-        return style.pixelMetric(QStyle.PM_MessageBoxIconSize)
-    elif constant == 'small':
-        return style.pixelMetric(QStyle.PM_SmallIconSize)
-    elif constant == 'large':
-        return style.pixelMetric(QStyle.PM_LargeIconSize)
-    elif constant == 'toolbar':
-        return style.pixelMetric(QStyle.PM_ToolBarIconSize)
-    elif constant == 'button':
-        return style.pixelMetric(QStyle.PM_ButtonIconSize)
+    try:
+        return _STANDARD_ICONSIZES[constant]
+    except KeyError:
+        pass
+
+    metric = STANDARD_ICONSIZE_METRICS.get(constant)
+    if metric is None:
+        return None
+
+    size = QApplication.instance().style().pixelMetric(metric)
+    _STANDARD_ICONSIZES[constant] = size
+    return size
+
+
+def clear_style_cache():
+    """
+    Clear the cached standard icon sizes and default contents margins, so
+    that they are resolved again from the application style (e.g. after a
+    change of style or theme).
+    """
+    _STANDARD_ICONSIZES.clear()
+    clear_contents_margins_cache()
 
 
 class IconManager:
@@ -66,20 +101,91 @@ class IconManager:
                  local_icons: dict = None,
                  icon_sizes: dict = DEFAULT_ICON_SIZES,
                  default_color: str = DEFAULT_ICON_COLOR):
-        self._qta_icons = qta_icons if qta_icons is not None else {}
+        # We normalize the qtawesome icons so that each entry is an
+        # (args, kwargs) pair, to avoid doing this each time an
+        # icon is created. The default color is also added to the kwargs
+        # of single icons for which no color is defined. Note that icons
+        # added to the 'qta_icons' dictionary after the manager is created
+        # are not available from it.
+        self._qta_icons = {}
+        for name, value in (qta_icons or {}).items():
+            args = tuple(value[0])
+            kwargs = dict(value[1]) if len(value) > 1 else {}
+            if len(args) == 1:
+                kwargs.setdefault('color', default_color)
+            self._qta_icons[name] = (args, kwargs)
+
         self._local_icons = local_icons if local_icons is not None else {}
         self._default_color = default_color
-        self._icon_sizes = icon_sizes
+        self._icon_sizes = {
+            name: QSize(*size) for name, size in icon_sizes.items()}
+
+        # A cache of the icons that were already created, keyed
+        # by (name, color).
+        self._icon_cache: dict[tuple, QIcon] = {}
+
+        # A cache of the local icons that were already created, keyed by
+        # name, since the color does not apply to local icons.
+        self._local_icon_cache: dict[str, QIcon] = {}
+
+        # The keys of the pixmaps that were stored in the QPixmapCache
+        # by this manager.
+        self._pixmap_token = next(_ICON_MANAGER_TOKENS)
+        self._pixmap_keys: set[str] = set()
 
     def get_icon(self, name, color: str = None):
         """Return a QIcon from a specified icon name."""
+        key = (name, color)
+        try:
+            return self._icon_cache[key]
+        except KeyError:
+            pass
+
+        icon = self._create_icon(name, color)
+        if QApplication.instance() is not None:
+            # We only cache icons once a QApplication exists, since
+            # qtawesome icons created before that are not valid.
+            self._icon_cache[key] = icon
+        return icon
+
+    def clear_cache(self):
+        """
+        Clear the cache of icons, so that they are created again the next
+        time they are requested (e.g. after a change of theme).
+        """
+        self._icon_cache.clear()
+        self._local_icon_cache.clear()
+        for key in self._pixmap_keys:
+            QPixmapCache.remove(key)
+        self._pixmap_keys.clear()
+
+    def get_pixmap(self, name, size: str, color: str = None) -> QPixmap:
+        """
+        Return a QPixmap of the icon named 'name' rendered at the
+        specified size.
+
+        Rendered pixmaps are stored in the QPixmapCache, so that each icon
+        is rasterized only once per size and color.
+        """
+        qsize = self._icon_sizes[size]
+        key = (f"qtapputils|{self._pixmap_token}|{name}|{color}|"
+               f"{qsize.width()}x{qsize.height()}")
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self.get_icon(name, color).pixmap(qsize)
+            QPixmapCache.insert(key, pixmap)
+            self._pixmap_keys.add(key)
+        return pixmap
+
+    def _create_icon(self, name, color: str = None):
+        """Create a new QIcon from a specified icon name."""
         if name in self._qta_icons:
-            try:
-                args, kwargs = deepcopy(self._qta_icons[name])
-            except ValueError:
-                args = deepcopy(self._qta_icons[name][0])
-                kwargs = {}
+            # We import qtawesome here to avoid the cost of loading its
+            # icon fonts at startup when no qtawesome icon is needed.
+            import qtawesome as qta
 
+            args, kwargs = self._qta_icons[name]
             if len(args) > 1:
                 # For icon made of multiple icons, you need to setup
                 # to color in the 'qta_icons' dictionary directly.
@@ -88,20 +194,23 @@ class IconManager:
             if color is not None:
                 # The color passed as argument always supersede the color
                 # define in the 'qta_icons' dictionary.
-                if color in CSS4_COLORS:
-                    kwargs['color'] = CSS4_COLORS[color]
-                else:
-                    kwargs['color'] = color
-            elif color is None and 'color' not in kwargs:
-                kwargs['color'] = self._default_color
+                kwargs = {**kwargs, 'color': CSS4_COLORS.get(color, color)}
             return qta.icon(*args, **kwargs)
         elif name in self._local_icons:
-            return QIcon(self._local_icons[name])
+            try:
+                return self._local_icon_cache[name]
+            except KeyError:
+                icon = self._local_icon_cache[name] = QIcon(
+                    self._local_icons[name])
+                return icon
         else:
             return QIcon()
 
-    def get_iconsize(self, size: str):
-        return QSize(*self._icon_sizes[size])
+    def get_iconsize(self, size: str) -> QSize:
+        """Return the QSize corresponding to the named icon size."""
+        # We return a copy, so that the cache cannot be modified by
+        # the caller.
+        return QSize(self._icon_sizes[size])
 
     @staticmethod
     def get_standard_icon(constant: str) -> QIcon:
@@ -112,66 +221,3 @@ class IconManager:
     def get_standard_iconsize(constant: 'str') -> int:
         """"A convenience method for the 'get_standard_iconsize' function."""
         return get_standard_iconsize(constant)
-
-
-if __name__ == '__main__':
-    import sys
-    from PyQt5.QtWidgets import QWidget, QHBoxLayout
-    from qtapputils.qthelpers import create_toolbutton, create_qapplication
-    from qtapputils.colors import RED, YELLOW, GREEN
-
-    app = create_qapplication()
-
-    ICOM = IconManager(
-        qta_icons={
-            'alert': [
-                ('mdi.alert-outline',),
-                {'color': GREEN}],
-            'home': [
-                ('mdi.home',),
-                {'scale_factor': 1.3}],
-            'save': [
-                ('mdi.content-save',),
-                {'color': RED, 'scale_factor': 1.2}],
-            }
-        )
-
-    window = QWidget()
-
-    icon1 = ICOM.get_icon('home')
-    icon2 = ICOM.get_icon('save')
-    icon3 = ICOM.get_icon('save', color=YELLOW)
-    icon4 = ICOM.get_icon('save', color='#FF007F')
-    icon5 = ICOM.get_icon('alert')
-
-    icon1.pixmap(48).save(
-        'D:/Projets/qtapputils/qtapputils/tests/home_icon.tiff', 'TIFF')
-    icon2.pixmap(48).save(
-        'D:/Projets/qtapputils/qtapputils/tests/red_save_icon.tiff', 'TIFF')
-    icon3.pixmap(48).save(
-        'D:/Projets/qtapputils/qtapputils/tests/yellow_save_icon.tiff', 'TIFF')
-    icon4.pixmap(48).save(
-        'D:/Projets/qtapputils/qtapputils/tests/pink_save_icon.tiff', 'TIFF')
-    icon5.pixmap(48).save(
-        'D:/Projets/qtapputils/qtapputils/tests/alert_icon.tiff', 'TIFF')
-
-    layout = QHBoxLayout(window)
-    layout.addWidget(create_toolbutton(
-        window,
-        icon=icon1,
-        iconsize=ICOM.get_iconsize('large')
-        ))
-    layout.addWidget(create_toolbutton(
-        window,
-        icon=icon2,
-        iconsize=ICOM.get_iconsize('small')))
-    layout.addWidget(create_toolbutton(
-        window,
-        icon=icon3,
-        iconsize=ICOM.get_iconsize('normal')))
-
-    window.show()
-
-    # pixmap.save(buffer, "PNG")
-
-    sys.exit(app.exec_())
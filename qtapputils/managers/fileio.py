@@ -13,7 +13,8 @@ from typing import Callable
 # ---- Standard imports
 import os
 import os.path as osp
-import uuid
+import tempfile
+import time
 
 # ---- Third party imports
 from qtpy.QtCore import QObject
@@ -21,6 +22,11 @@ from qtpy.QtWidgets import QMessageBox, QFileDialog, QWidget
 
 
 class SaveFileManager(QObject):
+    # The delays, in seconds, before retrying a write that failed with
+    # a PermissionError. This avoids prompting the user when the file is
+    # only briefly locked by another process, such as an antivirus scan.
+    permission_retry_delays = (0.05, 0.1, 0.2)
+
     def __init__(self, namefilters: dict, onsave: Callable,
                  parent: QWidget = None, atomic: bool = False):
         """
@@ -58,16 +64,44 @@ class SaveFileManager(QObject):
         self.onsave = onsave
         self.atomic = atomic
 
+        # Precompute the values needed by the 'Save As' file dialog.
+        self._ext_by_filter = {v: k for k, v in namefilters.items()}
+        self._joined_filters = ';;'.join(namefilters.values())
+
     def _get_valid_tempname(self, filename):
-        destdir = osp.dirname(filename)
-        while True:
-            tempname = osp.join(
-                destdir,
-                f'.temp_{str(uuid.uuid4())[:8]}_'
-                f'{osp.basename(filename)}'
-                )
-            if not osp.exists(tempname):
-                return tempname
+        fd, tempname = tempfile.mkstemp(
+            prefix='.temp_',
+            suffix=f'_{osp.basename(filename)}',
+            dir=osp.dirname(filename)
+            )
+        os.close(fd)
+
+        # We remove the empty file created by 'mkstemp', so that the file
+        # written by 'onsave' is created with the default permissions
+        # instead of the restrictive ones used by 'mkstemp'.
+        os.remove(tempname)
+
+        return tempname
+
+    def _retry_on_permission_error(self, func: Callable, *args, **kwargs):
+        """
+        Call 'func' with the provided arguments, retrying after a short
+        delay each time it raises a PermissionError.
+        """
+        for delay in self.permission_retry_delays:
+            try:
+                return func(*args, **kwargs)
+            except PermissionError:
+                time.sleep(delay)
+        return func(*args, **kwargs)
+
+    def _cleanup_tempfile(self, tempname):
+        """Remove the temp file left behind by a failed atomic save."""
+        if tempname is not None and osp.exists(tempname):
+            try:
+                os.remove(tempname)
+            except Exception:
+                pass
 
     def _get_new_save_filename(self, filename):
         root, ext = osp.splitext(filename)
@@ -79,12 +113,12 @@ class SaveFileManager(QObject):
             self.parent,
             "Save As",
             filename,
-            ';;'.join(self.namefilters.values()),
+            self._joined_filters,
             self.namefilters[ext])
 
         if filename:
             # Make sure the filename has the right extension.
-            ext = dict(map(reversed, self.namefilters.items()))[filefilter]
+            ext = self._ext_by_filter[filefilter]
             if not filename.endswith(ext):
                 filename += ext
 
@@ -142,7 +176,8 @@ class SaveFileManager(QObject):
                     tempname = self._get_valid_tempname(filename)
                     self.onsave(tempname, *args, **kwargs)
                     try:
-                        os.replace(tempname, filename)
+                        self._retry_on_permission_error(
+                            os.replace, tempname, filename)
                         return filename
                     except PermissionError:
                         if file_exists:
@@ -154,7 +189,8 @@ class SaveFileManager(QObject):
                         if not filename:
                             return None
                 else:
-                    self.onsave(filename, *args, **kwargs)
+                    self._retry_on_permission_error(
+                        self.onsave, filename, *args, **kwargs)
                     return filename
 
             except PermissionError:
@@ -172,11 +208,7 @@ class SaveFileManager(QObject):
                 return None
 
             finally:
-                if self.atomic and osp.exists(tempname):
-                    try:
-                        os.remove(tempname)
-                    except Exception:
-                        pass
+                self._cleanup_tempfile(tempname)
 
     def save_file_as(self, filename: str, *args, **kwargs) -> str:
         """
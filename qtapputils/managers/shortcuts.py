@@ -11,15 +11,18 @@
 Centralized Shortcut Manager for PyQt5 Applications
 """
 from typing import (
-    TYPE_CHECKING, Dict, Callable, Optional, List, Tuple, Protocol, Any)
+    TYPE_CHECKING, Dict, Callable, Optional, List, Tuple, Protocol, Any,
+    NamedTuple)
 if TYPE_CHECKING:
     from appconfigs.user import UserConfig
 
 # ---- Standard import
-from dataclasses import dataclass
-import configparser as cp
+from dataclasses import dataclass, field
+from functools import lru_cache
+import sys
 
 # ---- Third party import
+from qtpy.QtCore import QTimer
 from qtpy.QtWidgets import QWidget, QShortcut
 from qtpy.QtGui import QKeySequence
 
@@ -36,16 +39,52 @@ class UISyncTranslator(Protocol):
         ...
 
 
+def _hashable(shortcuts: list[str] | str) -> tuple[str] | str:
+    """Return the shortcuts in a form that can be used as a cache key."""
+    return tuple(shortcuts) if isinstance(shortcuts, list) else shortcuts
+
+
+@lru_cache(maxsize=256)
+def _get_native_text(shortcuts: tuple[str] | str) -> str:
+    return get_shortcuts_native_text(shortcuts)
+
+
+@lru_cache(maxsize=512)
+def _translate_action_menu(text: str, shortcuts: tuple[str] | str) -> tuple:
+    keystr = _get_native_text(shortcuts)
+    if keystr:
+        return f"{text}\t{keystr}",
+    else:
+        return text,
+
+
+@lru_cache(maxsize=512)
+def _translate_title(text: str, shortcuts: tuple[str] | str) -> tuple:
+    keystr = _get_native_text(shortcuts)
+    if keystr:
+        return f"{text} ({keystr})",
+    else:
+        return text,
+
+
+@lru_cache(maxsize=512)
+def _translate_tooltip(title: str, text: str, alt_text: str,
+                       shortcuts: tuple[str] | str) -> tuple:
+    if shortcuts:
+        return format_tooltip(title, alt_text, shortcuts),
+    else:
+        return format_tooltip(title, text, shortcuts),
+
+
+# The translators delegate to cached functions keyed on their text and on
+# the shortcuts, so that the UI of bound shortcuts can be updated without
+# converting and formatting the same key sequences over and over.
 class ActionMenuSyncTranslator:
     def __init__(self, text):
         self.text = text
 
     def __call__(self, shortcuts):
-        keystr = get_shortcuts_native_text(shortcuts)
-        if keystr:
-            return f"{self.text}\t{keystr}",
-        else:
-            return self.text,
+        return _translate_action_menu(self.text, _hashable(shortcuts))
 
 
 class TitleSyncTranslator:
@@ -53,11 +92,7 @@ class TitleSyncTranslator:
         self.text = text
 
     def __call__(self, shortcuts):
-        keystr = get_shortcuts_native_text(shortcuts)
-        if keystr:
-            return f"{self.text} ({keystr})",
-        else:
-            return self.text,
+        return _translate_title(self.text, _hashable(shortcuts))
 
 
 class ToolTipSyncTranslator:
@@ -67,10 +102,8 @@ class ToolTipSyncTranslator:
         self.alt_text = text if alt_text is None else alt_text
 
     def __call__(self, shortcuts):
-        if shortcuts:
-            return format_tooltip(self.title, self.alt_text, shortcuts),
-        else:
-            return format_tooltip(self.title, self.text, shortcuts),
+        return _translate_tooltip(
+            self.title, self.text, self.alt_text, _hashable(shortcuts))
 
 
 # =============================================================================
@@ -81,8 +114,41 @@ UISyncSetter = Callable[..., Any]
 UISyncTarget = Tuple[UISyncSetter, UISyncTranslator]
 
 
-@dataclass
-class ShortcutDefinition:
+def get_context_name(context: str, name: str) -> str:
+    """
+    Return the key used to store the shortcut named 'name' in 'context'.
+
+    The key is interned, so that it is shared by all the structures that
+    store this shortcut and compares quickly in dict lookups.
+    """
+    return sys.intern(f"{context}/{name}")
+
+
+def get_keys(qkey_sequence: QKeySequence) -> Tuple[int, ...]:
+    """Return the keys of a QKeySequence as a tuple of integers."""
+    return tuple(qkey_sequence[i] for i in range(qkey_sequence.count()))
+
+
+class KeySequenceData(NamedTuple):
+    """The data derived from a key sequence string."""
+    key_sequence: str
+    qkey_sequence: QKeySequence
+    text: str
+    native_text: str
+    keys: Tuple[int, ...]
+
+
+class _WeakrefSlot:
+    """
+    A base class that adds a '__weakref__' slot to the slotted dataclasses
+    that inherit from it, since the 'weakref_slot' argument of 'dataclass'
+    requires Python 3.11.
+    """
+    __slots__ = ('__weakref__',)
+
+
+@dataclass(slots=True)
+class ShortcutDefinition(_WeakrefSlot):
     """
     Declarative shortcut definition - describes a shortcut without
     creating any Qt objects.
@@ -94,22 +160,96 @@ class ShortcutDefinition:
     key_sequence: str
     description: str
 
-    @property
-    def context_name(self) -> str:
-        return f"{self.context}/{self.name}"
+    # A cache of the data derived from the key sequence, which is
+    # computed again only when the key sequence changes.
+    _qkey_cache: Optional[KeySequenceData] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    # The shortcut item this definition is bound to, if any.
+    _shortcut: Optional['ShortcutItem'] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    # A callback called with this definition when its key sequence is
+    # changed, so that the manager can keep its index up to date.
+    _on_key_sequence_changed: Optional[Callable] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    context_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.context_name = get_context_name(self.context, self.name)
+
+        # Parse the key sequence once when the shortcut is declared.
+        self._get_qkey_cache()
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name == 'key_sequence':
+            # The callback is not set yet when called from '__init__'.
+            callback = getattr(self, '_on_key_sequence_changed', None)
+            if callback is not None:
+                callback(self)
 
     @property
     def qkey_sequence(self) -> QKeySequence:
-        return QKeySequence(self.key_sequence)
+        return self._get_qkey_cache().qkey_sequence
+
+    def keystr(self, native: bool = False) -> str:
+        """
+        Return the key sequence as a string in the portable or
+        native format.
+        """
+        cache = self._get_qkey_cache()
+        return cache.native_text if native else cache.text
+
+    @property
+    def keys(self) -> Tuple[int, ...]:
+        """Return the keys of the key sequence as a tuple of integers."""
+        return self._get_qkey_cache().keys
+
+    @property
+    def is_empty(self) -> bool:
+        """Return whether the key sequence of this definition is empty."""
+        return len(self._get_qkey_cache().keys) == 0
+
+    def _get_qkey_cache(self) -> KeySequenceData:
+        """
+        Return the cached key sequence data, computing it again only if
+        the key sequence has changed.
+        """
+        cache = self._qkey_cache
+        if cache is None or cache.key_sequence != self.key_sequence:
+            qkey_sequence = QKeySequence(self.key_sequence)
+            cache = self._qkey_cache = KeySequenceData(
+                self.key_sequence,
+                qkey_sequence,
+                qkey_sequence.toString(),
+                qkey_sequence.toString(QKeySequence.NativeText),
+                get_keys(qkey_sequence)
+                )
+        return cache
 
     @property
     def is_bound(self) -> bool:
         """Check if this definition has been bound to actual UI."""
-        return hasattr(self, '_shortcut') and self._shortcut is not None
+        return self._shortcut is not None
 
     @property
     def shortcut(self) -> Optional['ShortcutItem']:
-        return getattr(self, '_shortcut', None)
+        return self._shortcut
+
+
+# The shortcut items whose activation was deferred until control returns
+# to the event loop. A dict is used as an insertion-ordered set.
+_PENDING_ACTIVATIONS: Dict['ShortcutItem', None] = {}
+
+
+def _activate_pending_shortcuts():
+    """Activate all shortcut items whose activation was deferred."""
+    pending = list(_PENDING_ACTIVATIONS)
+    _PENDING_ACTIVATIONS.clear()
+    for shortcut_item in pending:
+        shortcut_item.activate()
 
 
 class ShortcutItem:
@@ -117,6 +257,10 @@ class ShortcutItem:
     A shortcut that has been bound to actual UI elements.
     Created when lazy UI is finally instantiated.
     """
+    __slots__ = (
+        'definition', 'callback', 'parent', 'synced_ui_data',
+        '_synced_keystr', '_synced_ui_values', 'shortcut', 'enabled',
+        '_active', '__weakref__')
 
     def __init__(self, definition: ShortcutDefinition, callback: Callable,
                  parent: QWidget, synced_ui_data: List[UISyncTarget] = None):
@@ -126,8 +270,15 @@ class ShortcutItem:
         self.parent = parent
         self.synced_ui_data = synced_ui_data or []
 
+        # The key sequence string the synced UI was last updated with, and
+        # the last values passed to each synced UI setter, keyed by the
+        # index of the setter in 'synced_ui_data'.
+        self._synced_keystr: Optional[str] = None
+        self._synced_ui_values: Dict[int, tuple] = {}
+
         self.shortcut = None
         self.enabled = False
+        self._active = False
 
         self._update_ui()
 
@@ -136,49 +287,101 @@ class ShortcutItem:
         if self.shortcut is None:
             return ''
 
-        if native:
-            return self.definition.qkey_sequence.toString(
-                QKeySequence.NativeText)
-        else:
-            return self.definition.qkey_sequence.toString()
+        return self.definition.keystr(native)
 
-    def activate(self):
-        """Create and activate the QShortcut."""
-        if self.shortcut is None:
-            self.shortcut = QShortcut(
-                self.definition.qkey_sequence, self.parent)
-            self.shortcut.activated.connect(self.callback)
-            self.shortcut.setAutoRepeat(False)
+    def activate(self, defer: bool = False):
+        """
+        Create and activate the QShortcut.
+
+        Note that the QShortcut is not created while the key sequence is
+        empty, since it could never be triggered. It is created when a
+        key sequence is set on the active shortcut instead.
+
+        If 'defer' is True, the activation is postponed until control
+        returns to the event loop, so that the creation of many shortcuts
+        does not delay the display of the UI. All deferred activations are
+        processed together in a single callback.
+        """
+        if defer:
+            if not _PENDING_ACTIVATIONS:
+                QTimer.singleShot(0, _activate_pending_shortcuts)
+            _PENDING_ACTIVATIONS[self] = None
+            return
+
+        _PENDING_ACTIVATIONS.pop(self, None)
+        self._active = True
         self.set_enabled(True)
+        self._create_shortcut()
         self._update_ui()
 
     def deactivate(self):
         """Deactivate and clean up the QShortcut."""
+        _PENDING_ACTIVATIONS.pop(self, None)
         if self.shortcut is not None:
             self.shortcut.setEnabled(False)
+            # We disconnect the callback explicitly, so that it is not
+            # referenced by the QShortcut until it is actually deleted.
+            # This fails if the callback was changed or already
+            # disconnected, in which case there is nothing to do.
+            try:
+                self.shortcut.activated.disconnect(self.callback)
+            except TypeError:
+                pass
             self.shortcut.deleteLater()
             self.shortcut = None
         self.enabled = False
+        self._active = False
         self._update_ui()
 
     def set_keyseq(self, key_sequence: str):
-        """Update the key sequence."""
+        """
+        Update the key sequence.
+
+        Note that this does not check for conflicts. Use
+        'ShortcutManager.set_shortcut' to change the key sequence of a
+        shortcut declared in a manager.
+        """
         self.definition.key_sequence = key_sequence
         if self.shortcut is not None:
             self.shortcut.setKey(self.definition.qkey_sequence)
-            self._update_ui()
+        elif self._active:
+            self._create_shortcut()
+        self._update_ui()
 
     def set_enabled(self, enabled: bool = True):
         """Enable or disable the shortcut."""
+        if enabled == self.enabled:
+            return
         self.enabled = enabled
         if self.shortcut is not None:
             self.shortcut.setEnabled(enabled)
 
+    def _create_shortcut(self):
+        """
+        Create the QShortcut, unless it already exists or the key
+        sequence is empty.
+        """
+        if self.shortcut is not None or self.definition.is_empty:
+            return
+        self.shortcut = QShortcut(self.definition.qkey_sequence, self.parent)
+        self.shortcut.activated.connect(self.callback)
+        self.shortcut.setAutoRepeat(False)
+        self.shortcut.setEnabled(self.enabled)
+
     def _update_ui(self):
         """Update synced UI elements with current key sequence."""
         keystr = self.key_sequence
-        for setter, translator in self.synced_ui_data:
-            setter(*translator(keystr))
+        if keystr == self._synced_keystr:
+            return
+        self._synced_keystr = keystr
+
+        for i, (setter, translator) in enumerate(self.synced_ui_data):
+            values = translator(keystr)
+            # We skip setters whose values did not change to avoid
+            # needlessly triggering updates of the UI.
+            if self._synced_ui_values.get(i) != values:
+                self._synced_ui_values[i] = values
+                setter(*values)
 
 
 # =============================================================================
@@ -206,6 +409,23 @@ class ShortcutManager:
         # Shortcuts that have been bound to UI
         self._shortcuts: Dict[str, ShortcutItem] = {}
 
+        # The declared and bound shortcuts bucketed by context, so that
+        # iterating over a single context does not scan all shortcuts.
+        self._definitions_by_context: Dict[
+            str, Dict[str, ShortcutDefinition]] = {}
+        self._shortcuts_by_context: Dict[str, Dict[str, ShortcutItem]] = {}
+
+        # An index of the declared shortcuts by key sequence, used to find
+        # conflicts. Each definition is indexed under every prefix of its
+        # keys, since a key sequence conflicts with those that start
+        # with it or that it starts with.
+        self._keys_index: Dict[Tuple[int, ...], List[ShortcutDefinition]] = {}
+
+        # The keys under which each definition is indexed, keyed by
+        # context name. These are used to remove a definition from the
+        # index after its key sequence has changed.
+        self._indexed_keys: Dict[str, Tuple[int, ...]] = {}
+
     # =========================================================================
     # ---- Declaration methods
     # =========================================================================
@@ -222,22 +442,20 @@ class ShortcutManager:
         This allow populating the complete shortcut list, even before their
         UI exists..
         """
-        context_name = f"{context}/{name}"
+        context_name = get_context_name(context, name)
         if context_name in self._definitions:
             raise ValueError(
                 f"Shortcut '{name}' already declared for context '{context}'."
             )
 
         key_sequence = default_key_sequence
-        if self._userconfig is not None:
-            try:
-                # We don't pass the default value to 'get', because if
-                # option does not exists in 'shortcuts' section, the default
-                # is saved in the current user configs and we do not want
-                # that.
-                key_sequence = self._userconfig.get('shortcuts', context_name)
-            except (cp.NoOptionError, cp.NoSectionError):
-                pass
+        if (self._userconfig is not None and
+                self._userconfig.has_option('shortcuts', context_name)):
+            # We don't pass the default value to 'get', because if
+            # option does not exists in 'shortcuts' section, the default
+            # is saved in the current user configs and we do not want
+            # that.
+            key_sequence = self._userconfig.get('shortcuts', context_name)
 
         if self.check_conflicts(context, name, key_sequence):
             key_sequence = ''
@@ -250,11 +468,22 @@ class ShortcutManager:
             )
 
         self._definitions[context_name] = definition
+        self._definitions_by_context.setdefault(
+            context, {})[context_name] = definition
+        self._index_definition(definition)
+        definition._on_key_sequence_changed = self._reindex_definition
 
         return definition
 
     def declare_shortcuts(self, shortcuts: List[dict]):
-        """Bulk declare shortcuts from a list of definitions."""
+        """
+        Bulk declare shortcuts from a list of definitions.
+
+        Shortcuts are declared in order, so that when two of them conflict,
+        the key sequence of the one declared last is cleared. Since
+        conflicts are found with the key sequence index, the cost of each
+        declaration does not grow with the number of declared shortcuts.
+        """
         for sc in shortcuts:
             self.declare_shortcut(**sc)
 
@@ -268,24 +497,28 @@ class ShortcutManager:
             callback: Callable,
             parent: QWidget,
             synced_ui_data: Optional[List[UISyncTarget]] = None,
-            activate: bool = True
+            activate: bool = True,
+            defer_activation: bool = False
             ) -> ShortcutItem:
         """
         Bind a previously declared shortcut to actual UI elements.
         Call this when the lazy-loaded UI is finally created.
+
+        If 'defer_activation' is True, the QShortcut is created only when
+        control returns to the event loop (see ShortcutItem.activate).
         """
-        context_name = f"{context}/{name}"
-        if context_name not in self._definitions:
+        context_name = get_context_name(context, name)
+        definition = self._definitions.get(context_name)
+        if definition is None:
             raise ValueError(
                 f"Shortcut '{name}' in context '{context}' was not declared. "
                 f"Call declare_shortcut() first."
                 )
-        if context_name in self._shortcuts:
+        if definition.is_bound:
             raise ValueError(
                 f"Shortcut '{name}' in context '{context}' is already bound."
                 )
 
-        definition = self._definitions[context_name]
         shortcut = ShortcutItem(
             definition=definition,
             callback=callback,
@@ -296,40 +529,50 @@ class ShortcutManager:
         # Link back to definition
         definition._shortcut = shortcut
         self._shortcuts[context_name] = shortcut
+        self._shortcuts_by_context.setdefault(
+            context, {})[context_name] = shortcut
 
         if activate:
-            shortcut.activate()
+            shortcut.activate(defer=defer_activation)
 
         return shortcut
 
     def unbind_shortcut(self, context: str, name: str):
         """Unbind a shortcut."""
-        context_name = f"{context}/{name}"
-        if context_name in self._shortcuts:
-            self._shortcuts[context_name].deactivate()
-            self._definitions[context_name]._shortcut = None
+        context_name = get_context_name(context, name)
+        shortcut = self._shortcuts.get(context_name)
+        if shortcut is not None:
+            # We deactivate the shortcut before removing it from the
+            # manager, so that it is still tracked if this fails.
+            shortcut.deactivate()
+            shortcut.definition._shortcut = None
             del self._shortcuts[context_name]
 
+            bucket = self._shortcuts_by_context[context]
+            del bucket[context_name]
+            if not bucket:
+                del self._shortcuts_by_context[context]
+
     # =========================================================================
     # Shortcut Control
     # =========================================================================
     def activate_shortcut(self, context: str, name: str):
         """Activate a bound shortcut."""
-        context_name = f"{context}/{name}"
-        if context_name in self._shortcuts:
-            self._shortcuts[context_name].activate()
+        shortcut = self._shortcuts.get(get_context_name(context, name))
+        if shortcut is not None:
+            shortcut.activate()
 
     def deactivate_shortcut(self, context: str, name: str):
         """Deactivate a bound shortcut."""
-        context_name = f"{context}/{name}"
-        if context_name in self._shortcuts:
-            self._shortcuts[context_name].deactivate()
+        shortcut = self._shortcuts.get(get_context_name(context, name))
+        if shortcut is not None:
+            shortcut.deactivate()
 
     def enable_shortcut(self, context: str, name: str, enabled: bool = True):
         """Enable or disable a bound shortcut."""
-        context_name = f"{context}/{name}"
-        if context_name in self._shortcuts:
-            self._shortcuts[context_name].set_enabled(enabled)
+        shortcut = self._shortcuts.get(get_context_name(context, name))
+        if shortcut is not None:
+            shortcut.set_enabled(enabled)
 
     # =========================================================================
     # Iteration & Query
@@ -339,15 +582,15 @@ class ShortcutManager:
         Iterate over ALL shortcut definitions (complete list).
         Use this for the settings panel.
         """
-        for definition in self._definitions.values():
-            if context is None or context == definition.context:
-                yield definition
+        if context is None:
+            return iter(self._definitions.values())
+        return iter(self._definitions_by_context.get(context, {}).values())
 
     def iter_shortcuts(self, context: str = None):
         """Iterate over bound shortcuts only."""
-        for sc in self._shortcuts.values():
-            if context is None or context == sc.definition.context:
-                yield sc
+        if context is None:
+            return iter(self._shortcuts.values())
+        return iter(self._shortcuts_by_context.get(context, {}).values())
 
     # =========================================================================
     # Conflict Detection
@@ -377,38 +620,73 @@ class ShortcutManager:
 
         conflicts = self.find_conflicts(context, name, key_sequence)
         if conflicts:
+            conflicts_text = "\n".join(
+                f"  - shortcut '{sc.name}' in context '{sc.context}'"
+                for sc in conflicts)
             print_warning(
                 "ShortcutError",
                 f"Cannot set shortcut '{name}' in context '{context}' "
                 f"to '{key_sequence}' because of the following "
-                f"conflict(s):"
+                f"conflict(s):\n{conflicts_text}"
                 )
-            for sc in conflicts:
-                print(f"  - shortcut '{sc.name}' in context '{sc.context}'")
             return True
 
         return False
 
     def find_conflicts(self, context: str, name: str, key_sequence: str):
         """Check shortcuts for conflicts."""
-        conflicts = []
-        qkey_sequence = QKeySequence(key_sequence)
-        if qkey_sequence.isEmpty():
-            return conflicts
-
-        no_match = QKeySequence.SequenceMatch.NoMatch
-        for sc_def in self._definitions.values():
-            if sc_def.qkey_sequence.isEmpty():
-                continue
-            if (sc_def.context, sc_def.name) == (context, name):
-                continue
-            if sc_def.context in [context, '_'] or context == '_':
-                if sc_def.qkey_sequence.matches(qkey_sequence) != no_match:
-                    conflicts.append(sc_def)
-                elif qkey_sequence.matches(sc_def.qkey_sequence) != no_match:
-                    conflicts.append(sc_def)
-
-        return conflicts
+        keys = get_keys(QKeySequence(key_sequence))
+        if not keys:
+            return []
+
+        # Shortcuts whose key sequence starts with the key sequence.
+        candidates = list(self._keys_index.get(keys, []))
+
+        # Shortcuts whose key sequence is the start of the key sequence.
+        for i in range(1, len(keys)):
+            candidates.extend(
+                sc_def for sc_def in self._keys_index.get(keys[:i], []) if
+                len(sc_def.keys) == i)
+
+        # Context names are interned, so comparing them is mostly an
+        # identity check. Shortcuts in the global context '_' conflict
+        # with shortcuts in any context.
+        context_name = get_context_name(context, name)
+        if context == '_':
+            return [sc_def for sc_def in candidates if
+                    sc_def.context_name != context_name]
+
+        contexts = frozenset((context, '_'))
+        return [sc_def for sc_def in candidates if
+                sc_def.context in contexts and
+                sc_def.context_name != context_name]
+
+    def _index_definition(self, definition: ShortcutDefinition):
+        """Add a shortcut definition to the key sequence index."""
+        keys = definition.keys
+        self._indexed_keys[definition.context_name] = keys
+        for i in range(1, len(keys) + 1):
+            self._keys_index.setdefault(keys[:i], []).append(definition)
+
+    def _unindex_definition(self, definition: ShortcutDefinition):
+        """Remove a shortcut definition from the key sequence index."""
+        # We use the keys the definition was indexed under, since its
+        # key sequence may have changed since then.
+        keys = self._indexed_keys.pop(definition.context_name)
+        for i in range(1, len(keys) + 1):
+            indexed = self._keys_index[keys[:i]]
+            indexed.remove(definition)
+            if not indexed:
+                del self._keys_index[keys[:i]]
+
+    def _reindex_definition(self, definition: ShortcutDefinition):
+        """
+        Update the key sequence index after the key sequence of a
+        shortcut definition has changed.
+        """
+        if definition.keys != self._indexed_keys[definition.context_name]:
+            self._unindex_definition(definition)
+            self._index_definition(definition)
 
     # ---- End User Interface
     def print_shortcuts(self):
@@ -425,7 +703,7 @@ class ShortcutManager:
         print('-' * (context_w + name_w + 12))
         for scd in defs:
             print(f"{scd.context:<{context_w}}{scd.name:<{name_w}}"
-                  f"{scd.qkey_sequence.toString()}")
+                  f"{scd.keystr()}")
         print('-' * (context_w + name_w + 12))
 
     def set_shortcut(
@@ -463,31 +741,37 @@ class ShortcutManager:
         bool
             True if the update succeeded, False otherwise.
         """
-        context_name = f"{context}/{name}"
+        context_name = get_context_name(context, name)
 
-        if context_name not in self._definitions:
+        definition = self._definitions.get(context_name)
+        if definition is None:
             print_warning(
                 "ShortcutError",
                 f"Cannot find shortcut '{name}' in context '{context}'."
                 )
             return False
 
-        if self.check_conflicts(context, name, new_key_sequence):
-            return False
-
-        definition = self._definitions[context_name]
-        definition.key_sequence = new_key_sequence
-
-        # Update bound shortcut if it exists
-        if context_name in self._shortcuts:
-            self._shortcuts[context_name].set_keyseq(new_key_sequence)
+        qkey_sequence = QKeySequence(new_key_sequence)
+        keystr = qkey_sequence.toString()
+
+        # We skip the conflict check and the update of the shortcut when
+        # the key sequence is unchanged. Invalid key sequences are never
+        # skipped, so that the error is reported.
+        is_valid = keystr != '' or new_key_sequence in (None, '')
+        if not is_valid or keystr != definition.keystr():
+            if self.check_conflicts(context, name, new_key_sequence):
+                return False
+
+            # Update bound shortcut if it exists. Note that the key
+            # sequence index is updated when the key sequence of the
+            # definition is set.
+            if definition.is_bound:
+                definition.shortcut.set_keyseq(new_key_sequence)
+            else:
+                definition.key_sequence = new_key_sequence
 
         # Save to user config
         if self._userconfig is not None and sync_userconfig:
-            self._userconfig.set(
-                'shortcuts',
-                context_name,
-                QKeySequence(new_key_sequence).toString()
-                )
+            self._userconfig.set('shortcuts', context_name, keystr)
 
         return True
@@ -7,17 +7,15 @@
 # Licensed under the terms of the MIT License.
 # -----------------------------------------------------------------------------
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable, Any
-if TYPE_CHECKING:
-    from uuid import UUID
+from typing import Callable, Any
 
 # ---- Standard imports
-from collections import OrderedDict
-import uuid
-from time import sleep
+from collections import deque
+from contextlib import contextmanager
+import itertools
 
 # ---- Third party imports
-from qtpy.QtCore import QObject, QThread, Signal, Qt
+from qtpy.QtCore import QObject, QThread, Signal
 
 # ---- Local imports
 from qtapputils.qthelpers import qtwait
@@ -27,19 +25,37 @@ class WorkerBase(QObject):
     """
     A worker to execute tasks without blocking the GUI.
     """
+    # Emitted after each task with its ID and returned values.
     sig_task_completed = Signal(object, object)
 
+    # Emitted once all tasks are executed, with a list of the ID and
+    # returned values of each task. The manager is connected to this
+    # signal, so the callbacks of the tasks are called only after the
+    # whole run is finished. If a task raises an error, the results of
+    # the tasks that were completed before it are still emitted.
+    sig_tasks_completed = Signal(object)
+
     def __init__(self):
         super().__init__()
-        self._tasks: OrderedDict[Any, tuple[str, tuple, dict]] = OrderedDict()
+        # A FIFO queue of the tasks to execute.
+        self._tasks: deque[tuple[Any, str, tuple, dict]] = deque()
+
+        # A cache of the methods resolved from the task names.
+        self._methods: dict[str, Callable] = {}
 
     def _get_method(self, task: str):
+        try:
+            return self._methods[task]
+        except KeyError:
+            pass
+
         # Try direct, then fallback to underscore-prefixed (for backward
         # compatibility with older version of qtapputils).
         try:
             method = getattr(self, task)
         except AttributeError:
             method = getattr(self, '_' + task)
+        self._methods[task] = method
         return method
 
     def add_task(self, task_uuid4: Any, task: str, *args, **kargs):
@@ -47,26 +63,36 @@ class WorkerBase(QObject):
         Add a task to the stack.
         Parameters
         ----------
-        task_uuid4 : UUID or any hashable
+        task_uuid4 : int or any hashable
             Unique ID for the task.
         task : str
             The name of the method to execute.
         *args, **kargs :
             Arguments for the task.
         """
-        self._tasks[task_uuid4] = (task, args, kargs)
+        self._tasks.append((task_uuid4, task, args, kargs))
 
     def run_tasks(self):
         """Execute the tasks that were added to the stack."""
-        for task_uuid4, (task, args, kargs) in self._tasks.items():
-            if task is not None:
-                method_to_exec = self._get_method(task)
-                returned_values = method_to_exec(*args, **kargs)
-            else:
-                returned_values = args
-            self.sig_task_completed.emit(task_uuid4, returned_values)
-
-        self._tasks.clear()
+        # The results are sent in a single batch, to avoid a queued
+        # cross-thread call to the manager for each task.
+        # The bound methods used in the loop are resolved only once.
+        emit = self.sig_task_completed.emit
+        tasks = self._tasks
+        results = []
+        try:
+            while tasks:
+                task_uuid4, task, args, kargs = tasks[0]
+                if task is not None:
+                    method_to_exec = self._get_method(task)
+                    returned_values = method_to_exec(*args, **kargs)
+                else:
+                    returned_values = args
+                tasks.popleft()
+                results.append((task_uuid4, returned_values))
+                emit(task_uuid4, returned_values)
+        finally:
+            self.sig_tasks_completed.emit(results)
 
 
 class TaskManagerBase(QObject):
@@ -83,8 +109,16 @@ class TaskManagerBase(QObject):
         self._worker = None
         self._thread_is_quitting = False
 
-        self._task_callbacks: dict[uuid.UUID, Callable] = {}
-        self._task_data: dict[uuid.UUID, tuple[str, tuple, dict]] = {}
+        # The depth of nested 'batch' contexts and whether 'run_tasks' was
+        # called while batching.
+        self._batch_depth = 0
+        self._batch_run_requested = False
+
+        # Tasks are identified with integers from a monotonic counter,
+        # which are cheaper to generate and hash than UUIDs.
+        self._task_ids = itertools.count()
+        self._task_callbacks: dict[int, Callable] = {}
+        self._task_data: dict[int, tuple[str, tuple, dict]] = {}
 
         self._running_tasks = []
         self._queued_tasks = []
@@ -130,7 +164,29 @@ class TaskManagerBase(QObject):
         """
         if callback is not None:
             self.add_task(None, callback, returned_values)
-        self._run_tasks()
+        if self._batch_depth > 0:
+            self._batch_run_requested = True
+        else:
+            self._run_tasks()
+
+    @contextmanager
+    def batch(self):
+        """
+        A context manager to run all the tasks requested within it in
+        a single batch.
+
+        Calls to 'run_tasks' made within the context are deferred until
+        the outermost context exits, so that the worker thread is started
+        only once for all of them.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_run_requested:
+                self._batch_run_requested = False
+                self._run_tasks()
 
     def add_task(self, task: str, callback: Callable, *args, **kargs):
         """Add a new task at the end of the queued tasks stack."""
@@ -149,15 +205,24 @@ class TaskManagerBase(QObject):
         self._thread.started.connect(self._worker.run_tasks)
         self._thread.finished.connect(self._handle_thread_finished)
 
-        self._worker.sig_task_completed.connect(self._handle_task_completed)
+        self._worker.sig_tasks_completed.connect(
+            self._handle_tasks_completed)
 
     # ---- Private API
+    def _handle_tasks_completed(
+            self, results: list[tuple[int, tuple]]) -> None:
+        """
+        Handle when a batch of tasks has been completed by the worker.
+        """
+        for task_uuid4, returned_values in results:
+            self._handle_task_completed(task_uuid4, returned_values)
+
     def _handle_task_completed(
-            self, task_uuid4: uuid.UUID, returned_values: tuple) -> None:
+            self, task_uuid4: int, returned_values: tuple) -> None:
         """
         Handle when a task has been completed by the worker.
 
-        This is the ONLY slot that should be called after a task is
+        This is the ONLY method that should be called after a task is
         completed by the worker.
         """
         # Execute the callback associated with this task (if one exists).
@@ -201,8 +266,8 @@ class TaskManagerBase(QObject):
                 print('All pending tasks were executed.')
             self.sig_run_tasks_finished.emit()
 
-    def _cleanup_task(self, task_uuid4: uuid.UUID):
-        """Cleanup task associated with the specified UUID."""
+    def _cleanup_task(self, task_uuid4: int):
+        """Cleanup task associated with the specified ID."""
         del self._task_callbacks[task_uuid4]
         del self._task_data[task_uuid4]
         if task_uuid4 in self._running_tasks:
@@ -210,7 +275,7 @@ class TaskManagerBase(QObject):
 
     def _add_task(self, task: str, callback: Callable, *args, **kargs):
         """Add a new task at the end of the stack of queued tasks."""
-        task_uuid4 = uuid.uuid4()
+        task_uuid4 = next(self._task_ids)
         self._task_callbacks[task_uuid4] = callback
         self._queued_tasks.append(task_uuid4)
         self._task_data[task_uuid4] = (task, args, kargs)
@@ -220,7 +285,7 @@ class TaskManagerBase(QObject):
         Execute all the tasks that were added to the stack of queued tasks.
         """
         self._pending_tasks.extend(self._queued_tasks)
-        self._queued_tasks = []
+        self._queued_tasks.clear()
         if len(self._running_tasks) == 0:
             self.sig_run_tasks_started.emit()
         self._run_pending_tasks()
@@ -242,9 +307,10 @@ class TaskManagerBase(QObject):
         if self.verbose:
             print(f'Executing {len(self._pending_tasks)} pending tasks...')
 
-        # Move all pending tasks to the running tasks queue.
-        self._running_tasks = self._pending_tasks.copy()
-        self._pending_tasks = []
+        # Move all pending tasks to the running tasks queue. Since there
+        # are no running tasks, we simply swap the two lists.
+        self._running_tasks, self._pending_tasks = (
+            self._pending_tasks, self._running_tasks)
 
         # Add each running task to the worker's queue.
         for task_uuid4 in self._running_tasks:
@@ -269,6 +335,6 @@ class LIFOTaskManager(TaskManagerBase):
         """
         for task_uuid4 in self._pending_tasks:
             self._cleanup_task(task_uuid4)
-        self._queued_tasks = []
-        self._pending_tasks = []
+        self._queued_tasks.clear()
+        self._pending_tasks.clear()
         super()._add_task(task, callback, *args, **kargs)
@@ -12,6 +12,7 @@ Tests for the fileio managers.
 """
 
 # ---- Standard imports
+import os
 import os.path as osp
 
 # ---- Third party imports
@@ -208,6 +209,51 @@ def test_save_file_as_cancel(tmp_path, mocker, atomic, parent):
     assert not osp.exists(filename)
 
 
+@pytest.mark.parametrize('atomic', [True, False])
+def test_save_file_transient_lock(tmp_path, mocker, atomic, parent):
+    """
+    Test that saving is retried when a PermissionError is raised only
+    temporarily, without prompting the user.
+    """
+    attempts = []
+
+    def onsave(filename, *args, **kwargs):
+        attempts.append(filename)
+        if len(attempts) < 3:
+            raise PermissionError("File temporarily locked")
+        dummy_onsave_success(filename)
+
+    manager = SaveFileManager(
+        namefilters=NAMEFILTERS,
+        onsave=onsave if not atomic else dummy_onsave_success,
+        parent=parent,
+        atomic=atomic
+        )
+    if atomic:
+        # Patch os.replace to fail on the first two attempts.
+        os_replace = os.replace
+
+        def replace(src, dst):
+            attempts.append(dst)
+            if len(attempts) < 3:
+                raise PermissionError("File temporarily locked")
+            os_replace(src, dst)
+        mocker.patch("os.replace", side_effect=replace)
+
+    qmsgbox_patcher = mocker.patch.object(
+        QMessageBox, 'warning', return_value=QMessageBox.Ok
+        )
+
+    filename = osp.join(tmp_path, "file.txt")
+    result = manager.save_file(filename)
+
+    assert result == filename
+    assert len(attempts) == 3
+    assert qmsgbox_patcher.call_count == 0
+    with open(filename) as f:
+        assert f.read() == "data"
+
+
 def test_atomic_save_replace_permission_error(tmp_path, mocker, parent):
     """Test atomic save when os.replace raises PermissionError."""
     manager = SaveFileManager(
@@ -12,9 +12,10 @@ Tests for the Centralized Shortcut Manager
 """
 
 import configparser as cp
+import weakref
 import pytest
-from unittest.mock import Mock
-from PyQt5.QtWidgets import QPushButton
+from unittest.mock import Mock, patch
+from PyQt5.QtWidgets import QCheckBox, QPushButton
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtCore import Qt
 
@@ -55,6 +56,9 @@ def userconfig():
             else:
                 raise cp.NoOptionError(option, section)
 
+        def has_option(self, section, option):
+            return section == 'shortcuts' and option in self._config
+
         def set(self, section, option, value):
             if section != 'shortcuts':
                 raise KeyError(
@@ -133,12 +137,18 @@ def test_uisync_translator():
     translator = ActionMenuSyncTranslator("Save")
     assert translator("Ctrl+S") == ("Save\tCtrl+S",)
     assert translator("") == ("Save",)
+    assert translator(["Ctrl+S", "Ctrl+Shift+S"]) == (
+        "Save\tCtrl+S, Ctrl+Shift+S",)
 
     # Test title sync translator with and without shortcut.
     translator = TitleSyncTranslator("Save File")
     assert translator("Ctrl+S") == ("Save File (Ctrl+S)",)
     assert translator("") == ("Save File",)
 
+    # Test that changing the text of a translator is taken into account.
+    translator.text = "Save As"
+    assert translator("Ctrl+S") == ("Save As (Ctrl+S)",)
+
     # Test tooltip sync translator with and without shortcut.
     translator = ToolTipSyncTranslator(
         title="Save",
@@ -155,21 +165,38 @@ def test_uisync_translator():
 
 
 def test_shortcut_definition(definition):
+    assert definition._qkey_cache is not None
     assert definition.context_name == "file/save"
     assert definition.qkey_sequence == QKeySequence("Ctrl+S")
+    assert definition.keystr() == "Ctrl+S"
+    assert definition.is_empty is False
     assert definition.is_bound is False
     assert definition.shortcut is None
 
+    # Test that shortcut definitions can be weakly referenced.
+    assert weakref.ref(definition)() is definition
+
     # Test the shortcut definition is bound after binding.
     definition._shortcut = Mock()
     assert definition.is_bound is True
     assert definition.shortcut is not None
 
+    # Test that the QKeySequence is cached and updated when the key
+    # sequence changes.
+    assert definition.qkey_sequence is definition.qkey_sequence
+    definition.key_sequence = "Ctrl+Shift+S"
+    assert definition.qkey_sequence == QKeySequence("Ctrl+Shift+S")
+    assert definition.keystr() == "Ctrl+Shift+S"
+    definition.key_sequence = ""
+    assert definition.is_empty is True
+
 
 def test_shortcut_item(shortcut_item, widget, qtbot):
     widget.show()
     qtbot.wait(300)
 
+    assert not hasattr(shortcut_item, '__dict__')
+
     # Initially not activated.
     assert shortcut_item.shortcut is None
     assert widget.text() == 'Save'
@@ -218,8 +245,14 @@ def test_shortcut_item(shortcut_item, widget, qtbot):
     shortcut_item.callback.call_count == 2
 
     # Deactivate shortcut item.
+    qshortcut = shortcut_item.shortcut
+    call_count = shortcut_item.callback.call_count
     shortcut_item.deactivate()
     assert shortcut_item.shortcut is None
+
+    # The callback is disconnected before the QShortcut is deleted.
+    qshortcut.activated.emit()
+    assert shortcut_item.callback.call_count == call_count
     assert shortcut_item.enabled is False
     assert widget.text() == 'Save'
     assert widget.toolTip() == (
@@ -231,6 +264,125 @@ def test_shortcut_item(shortcut_item, widget, qtbot):
     shortcut_item.callback.call_count == 2
 
 
+def test_shortcut_item_signal_connection(shortcut_item, qtbot):
+    """
+    Test that Qt signals can be connected to the methods of a
+    shortcut item.
+    """
+    assert weakref.ref(shortcut_item)() is shortcut_item
+
+    checkbox = QCheckBox()
+    qtbot.addWidget(checkbox)
+    checkbox.toggled.connect(shortcut_item.set_enabled)
+
+    checkbox.setChecked(True)
+    assert shortcut_item.enabled is True
+    checkbox.setChecked(False)
+    assert shortcut_item.enabled is False
+
+
+def test_shortcut_item_deactivate_disconnected(shortcut_item):
+    """
+    Test that a shortcut item is deactivated even when its callback is
+    not connected to its QShortcut.
+    """
+    shortcut_item.activate()
+    assert shortcut_item.shortcut is not None
+
+    shortcut_item.callback = Mock()
+    shortcut_item.deactivate()
+    assert shortcut_item.shortcut is None
+    assert shortcut_item.enabled is False
+
+    # The callback is already disconnected.
+    shortcut_item.activate()
+    shortcut_item.shortcut.activated.disconnect(shortcut_item.callback)
+    shortcut_item.deactivate()
+    assert shortcut_item.shortcut is None
+
+
+def test_shortcut_item_empty_key_sequence(widget):
+    """
+    Test that the QShortcut of an active shortcut item is created only
+    once it has a key sequence.
+    """
+    definition = ShortcutDefinition(
+        context="file", name="save", key_sequence="", description="")
+    shortcut_item = ShortcutItem(
+        definition=definition, callback=Mock(), parent=widget)
+
+    shortcut_item.activate()
+    assert shortcut_item.shortcut is None
+    assert shortcut_item.enabled is True
+
+    shortcut_item.set_keyseq("Ctrl+S")
+    assert shortcut_item.shortcut is not None
+    assert shortcut_item.shortcut.isEnabled() is True
+    assert shortcut_item.shortcut.key() == QKeySequence("Ctrl+S")
+
+    # Setting a key sequence on an inactive item does not create it.
+    shortcut_item.deactivate()
+    shortcut_item.set_keyseq("Ctrl+A")
+    assert shortcut_item.shortcut is None
+
+
+def test_shortcut_item_deferred_activation(definition, widget, qtbot):
+    """
+    Test that deferred activations are processed together when control
+    returns to the event loop.
+    """
+    items = [ShortcutItem(definition=definition,
+                          callback=Mock(),
+                          parent=widget) for i in range(3)]
+    for item in items:
+        item.activate(defer=True)
+    assert all(item.shortcut is None for item in items)
+
+    # Deactivating a shortcut cancels its pending activation.
+    items[2].deactivate()
+
+    qtbot.waitUntil(lambda: items[0].shortcut is not None)
+    assert items[0].enabled is True
+    assert items[1].shortcut is not None
+    assert items[1].enabled is True
+    assert items[2].shortcut is None
+    assert items[2].enabled is False
+
+
+def test_shortcut_item_skip_unchanged_ui(definition, widget):
+    """
+    Test that synced UI setters are only called when the values they
+    would receive have changed.
+    """
+    setter = Mock()
+    translator = Mock(wraps=TitleSyncTranslator("Save"))
+    shortcut_item = ShortcutItem(
+        definition=definition,
+        callback=Mock(),
+        parent=widget,
+        synced_ui_data=[(setter, translator)]
+        )
+    setter.assert_called_once_with("Save")
+    assert translator.call_count == 1
+
+    shortcut_item.activate()
+    assert setter.call_count == 2
+    setter.assert_called_with("Save (Ctrl+S)")
+
+    # Enabling or activating again does not change the UI values, nor
+    # the state of the QShortcut.
+    with patch.object(shortcut_item.shortcut, 'setEnabled') as set_enabled:
+        shortcut_item.set_enabled(True)
+        shortcut_item.activate()
+    assert setter.call_count == 2
+    assert translator.call_count == 2
+    assert set_enabled.call_count == 0
+
+    shortcut_item.set_keyseq("Ctrl+A")
+    assert setter.call_count == 3
+    setter.assert_called_with("Save (Ctrl+A)")
+
+
 # =============================================================================
 # ShortcutManager Tests
 # =============================================================================
@@ -287,6 +439,31 @@ def test_declare_shortcut(capsys):
     assert len(list(manager.iter_definitions())) == 5
 
 
+def test_declare_shortcuts_conflicts(capsys):
+    """
+    Test that the key sequences of conflicting shortcuts declared in bulk
+    are cleared, except for the first declared one.
+    """
+    manager = ShortcutManager()
+    manager.declare_shortcuts([
+        {'context': 'file', 'name': 'save', 'default_key_sequence': 'Ctrl+S'},
+        {'context': 'file', 'name': 'copy', 'default_key_sequence': 'Ctrl+S'},
+        {'context': '_', 'name': 'search', 'default_key_sequence': 'Ctrl+S'},
+        {'context': 'edit', 'name': 'sort', 'default_key_sequence': 'Ctrl+S'},
+        ])
+
+    assert [d.key_sequence for d in manager.iter_definitions()] == [
+        'Ctrl+S', '', '', 'Ctrl+S']
+
+    captured = capsys.readouterr()
+    assert captured.out.count("ShortcutError") == 2
+    assert captured.out.endswith(
+        "Cannot set shortcut 'search' in context '_' to 'Ctrl+S' because "
+        "of the following conflict(s):\n"
+        "  - shortcut 'save' in context 'file'\n"
+        )
+
+
 def test_declare_shortcut_with_userconfig(userconfig):
     manager = ShortcutManager(userconfig=userconfig)
 
@@ -329,7 +506,7 @@ def test_declare_shortcut_with_userconfig(userconfig):
     assert definition.qkey_sequence.toString() == ""
 
 
-def test_bind_shortcut(widget):
+def test_bind_shortcut(widget, qtbot):
     manager = ShortcutManager()
 
     # Bind a shortcut.
@@ -352,6 +529,17 @@ def test_bind_shortcut(widget):
         )
     assert shortcut_item.shortcut is not None
 
+    # Bind a shortcut, but defer its activation.
+    manager.declare_shortcut(
+        context="file", name="print", default_key_sequence="Ctrl+P"
+        )
+    shortcut_item = manager.bind_shortcut(
+        context="file", name="print", callback=Mock(), parent=widget,
+        defer_activation=True
+        )
+    assert shortcut_item.shortcut is None
+    qtbot.waitUntil(lambda: shortcut_item.shortcut is not None)
+
     # Bind a shortcut, but set 'activate' to False.
     manager.declare_shortcut(
         context="file", name="open", default_key_sequence="Ctrl+O"
@@ -434,7 +622,7 @@ def test_shortcut_controls(widget, qtbot):
     shortcut_item.callback.call_count == 2
 
 
-def test_set_shortcut(widget, capsys):
+def test_set_shortcut(widget, capsys, mocker):
     manager = ShortcutManager()
 
     manager.declare_shortcut(
@@ -455,6 +643,18 @@ def test_set_shortcut(widget, capsys):
     assert [d.key_sequence for d in manager.iter_definitions()] == [
         "Alt+S"]
 
+    # Set the same key sequence again, which should skip the conflicts
+    # check and leave the shortcut unchanged.
+    check_conflicts = mocker.patch.object(
+        manager, 'check_conflicts', wraps=manager.check_conflicts)
+    assert manager.set_shortcut("file", "save", "alt+s")
+    assert check_conflicts.call_count == 0
+    assert [d.key_sequence for d in manager.iter_definitions()] == [
+        "Alt+S"]
+
+    assert manager.set_shortcut("file", "save", "Alt+Shift+S")
+    assert check_conflicts.call_count == 1
+
     # Try setting a key sequence to an invalid shortcut name.
     captured = capsys.readouterr()
     assert "ShortcutError" not in captured.out
@@ -517,6 +717,8 @@ def test_iter_definitions(populated_manager):
     assert len(file_defs) == 2
     assert all(d.context == "file" for d in file_defs)
 
+    assert list(populated_manager.iter_definitions(context="unknown")) == []
+
 
 def test_iter_bound_shortcuts(populated_manager):
     all_bound = list(populated_manager.iter_shortcuts())
@@ -526,6 +728,10 @@ def test_iter_bound_shortcuts(populated_manager):
     assert len(file_bound) == 1
     assert file_bound[0].definition. context == "file"
 
+    populated_manager.unbind_shortcut("file", "save")
+    assert list(populated_manager.iter_shortcuts(context="file")) == []
+    assert len(list(populated_manager.iter_shortcuts())) == 1
+
 
 def test_blocklist(userconfig, capsys):
     manager = ShortcutManager(blocklist=['Ctrl+Z'])
@@ -595,6 +801,100 @@ def test_find_conflicts(populated_manager, capsys):
     assert "ShortcutError" in captured.out
 
 
+def test_find_conflicts_multi_keys(populated_manager):
+    """
+    Test that key sequences conflict with the key sequences that start
+    with them and with those they start with.
+    """
+    # A multi-keys sequence starting with an existing shortcut.
+    conflicts = populated_manager.find_conflicts(
+        "file", "newaction", "Ctrl+S, Ctrl+A")
+    assert [sc.name for sc in conflicts] == ["save"]
+
+    # A key sequence that is the start of an existing multi-keys shortcut.
+    populated_manager.declare_shortcut(
+        context="view", name="zoom", default_key_sequence="Ctrl+K, Ctrl+Z"
+        )
+    conflicts = populated_manager.find_conflicts("view", "newaction", "Ctrl+K")
+    assert [sc.name for sc in conflicts] == ["zoom"]
+
+    conflicts = populated_manager.find_conflicts(
+        "view", "newaction", "Ctrl+K, Ctrl+X")
+    assert len(conflicts) == 0
+
+    # Test that the index is updated when a key sequence is changed.
+    assert populated_manager.set_shortcut("view", "zoom", "Ctrl+K, Ctrl+X")
+    conflicts = populated_manager.find_conflicts(
+        "view", "newaction", "Ctrl+K, Ctrl+Z")
+    assert len(conflicts) == 0
+    conflicts = populated_manager.find_conflicts(
+        "view", "newaction", "Ctrl+K, Ctrl+X")
+    assert [sc.name for sc in conflicts] == ["zoom"]
+
+
+def test_find_conflicts_after_keyseq_change(widget):
+    """
+    Test that the key sequence index is kept up to date when the key
+    sequence of a shortcut is changed outside of 'set_shortcut'.
+    """
+    manager = ShortcutManager()
+    definition = manager.declare_shortcut(
+        context="file", name="save", default_key_sequence="Ctrl+S"
+        )
+    shortcut_item = manager.bind_shortcut(
+        context="file", name="save", callback=Mock(), parent=widget
+        )
+
+    # Change the key sequence from the bound shortcut item.
+    shortcut_item.set_keyseq("Ctrl+B")
+    conflicts = manager.find_conflicts("file", "newaction", "Ctrl+B")
+    assert [sc.name for sc in conflicts] == ["save"]
+    assert manager.find_conflicts("file", "newaction", "Ctrl+S") == []
+
+    assert manager.set_shortcut("file", "save", "Ctrl+D")
+    conflicts = manager.find_conflicts("file", "newaction", "Ctrl+D")
+    assert [sc.name for sc in conflicts] == ["save"]
+    assert manager.find_conflicts("file", "newaction", "Ctrl+B") == []
+
+    # Change the key sequence of the definition directly.
+    definition.key_sequence = "Ctrl+K, Ctrl+S"
+    conflicts = manager.find_conflicts("file", "newaction", "Ctrl+K")
+    assert [sc.name for sc in conflicts] == ["save"]
+    assert manager.find_conflicts("file", "newaction", "Ctrl+D") == []
+
+    definition.key_sequence = ""
+    assert manager.find_conflicts("file", "newaction", "Ctrl+K") == []
+    assert manager._keys_index == {}
+
+
+def test_unbind_shortcut_deactivate_error(widget, mocker):
+    """
+    Test that a shortcut is still tracked by the manager when its
+    deactivation fails while unbinding it.
+    """
+    manager = ShortcutManager()
+    definition = manager.declare_shortcut(
+        context="file", name="save", default_key_sequence="Ctrl+S"
+        )
+    shortcut_item = manager.bind_shortcut(
+        context="file", name="save", callback=Mock(), parent=widget
+        )
+
+    mocker.patch.object(
+        ShortcutItem, 'deactivate', side_effect=RuntimeError)
+    with pytest.raises(RuntimeError):
+        manager.unbind_shortcut("file", "save")
+    assert definition.is_bound is True
+    assert list(manager.iter_shortcuts()) == [shortcut_item]
+    assert list(manager.iter_shortcuts("file")) == [shortcut_item]
+    mocker.stopall()
+
+    manager.unbind_shortcut("file", "save")
+    assert definition.is_bound is False
+    assert list(manager.iter_shortcuts()) == []
+    assert list(manager.iter_shortcuts("file")) == []
+
+
 def test_full_lifecycle(widget, qtbot):
     """Test complete declare -> bind -> use -> unbind lifecycle."""
     widget.show()
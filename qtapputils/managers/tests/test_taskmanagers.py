@@ -12,7 +12,7 @@ Tests for the taskmanagers module.
 """
 
 # ---- Standard imports
-from time import sleep
+from threading import Event
 
 # ---- Third party imports
 import pytest
@@ -31,13 +31,22 @@ def DATA():
 
 
 @pytest.fixture
-def worker(DATA):
+def worker_gate():
+    """
+    An event that blocks the tasks of the worker until it is set, so that
+    tests can check the state of the managers while the worker is busy.
+    """
+    return Event()
+
+
+@pytest.fixture
+def worker(DATA, worker_gate):
     def _get_something():
-        sleep(0.5)
+        worker_gate.wait(timeout=5)
         return DATA.copy(),
 
     def _set_something(index, value):
-        sleep(0.5)
+        worker_gate.wait(timeout=5)
         DATA[index] = value
 
     worker = WorkerBase()
@@ -73,7 +82,34 @@ def lifo_task_manager(worker, qtbot):
 # =============================================================================
 # ---- Tests
 # =============================================================================
-def test_run_tasks(task_manager, qtbot):
+def test_worker_run_tasks_error(worker, worker_gate, DATA):
+    """
+    Test that the worker sends the results of the tasks that were
+    completed before a task raised an error.
+    """
+    worker_gate.set()
+
+    def _raise_error():
+        raise ValueError
+
+    worker.raise_error = _raise_error
+
+    completed_signal_spy = QSignalSpy(worker.sig_tasks_completed)
+    worker.add_task(0, 'get_something')
+    worker.add_task(1, 'raise_error')
+    worker.add_task(2, 'get_something')
+    with pytest.raises(ValueError):
+        worker.run_tasks()
+
+    assert len(completed_signal_spy) == 1
+    assert completed_signal_spy[0][0] == [(0, (DATA, ))]
+
+    # The task that raised the error and the following ones are
+    # left in the stack.
+    assert [task[0] for task in worker._tasks] == [1, 2]
+
+
+def test_run_tasks(task_manager, worker_gate, qtbot):
     """
     Test that the task manager is managing queued tasks as expected.
     """
@@ -85,6 +121,10 @@ def test_run_tasks(task_manager, qtbot):
     # Add spy to the signals.
     start_signal_spy = QSignalSpy(task_manager.sig_run_tasks_started)
     end_signal_spy = QSignalSpy(task_manager.sig_run_tasks_finished)
+    completed_signal_spy = QSignalSpy(
+        task_manager.worker().sig_tasks_completed)
+    task_completed_signal_spy = QSignalSpy(
+        task_manager.worker().sig_task_completed)
 
     # Add some tasks to the manager.
     task_manager.add_task('get_something', task_callback)
@@ -92,7 +132,7 @@ def test_run_tasks(task_manager, qtbot):
     task_manager.add_task('set_something', None, 2, -19.5)
     task_manager.add_task('get_something', task_callback)
 
-    assert len(task_manager._queued_tasks) == 4
+    assert task_manager._queued_tasks == [0, 1, 2, 3]
     assert len(task_manager._pending_tasks) == 0
     assert len(task_manager._running_tasks) == 0
     assert returned_values == []
@@ -105,6 +145,7 @@ def test_run_tasks(task_manager, qtbot):
     assert len(task_manager._pending_tasks) == 0
     assert len(task_manager._running_tasks) == 4
 
+    worker_gate.set()
     qtbot.waitUntil(lambda: len(end_signal_spy) == 1, timeout=5000)
 
     assert len(task_manager._running_tasks) == 0
@@ -113,12 +154,20 @@ def test_run_tasks(task_manager, qtbot):
     assert returned_values[1] == [1, 2, 3, 4]
     assert returned_values[2] == [1, 2, -19.5, 4]
 
-    # We assert that each signal were called only once.
+    # We assert that each signal were called only once and that the
+    # results of the tasks were sent by the worker in a single batch.
     assert len(start_signal_spy) == 1
     assert len(end_signal_spy) == 1
+    assert len(completed_signal_spy) == 1
+    assert len(completed_signal_spy[0][0]) == 4
+    assert len(task_completed_signal_spy) == 4
 
+    # We assert that the methods of the tasks were resolved only once.
+    assert list(task_manager.worker()._methods) == [
+        'get_something', 'set_something']
 
-def test_run_tasks_if_busy(task_manager, qtbot):
+
+def test_run_tasks_if_busy(task_manager, worker_gate, qtbot):
     """
     Test that the manager is managing the queued tasks as expected
     when adding new tasks while the worker is busy.
@@ -166,6 +215,7 @@ def test_run_tasks_if_busy(task_manager, qtbot):
     assert len(task_manager._running_tasks) == 3
     assert task_manager._thread.isRunning()
 
+    worker_gate.set()
     qtbot.waitUntil(lambda: len(end_signal_spy) == 1, timeout=5000)
 
     # We then assert that all tasks have been executed as expected.
@@ -183,7 +233,46 @@ def test_run_tasks_if_busy(task_manager, qtbot):
     assert len(end_signal_spy) == 1
 
 
-def test_lifo_run_tasks(lifo_task_manager, qtbot, DATA):
+def test_run_tasks_batch(task_manager, worker_gate, qtbot):
+    """
+    Test that the tasks requested to run within a batch context are
+    executed in a single run of the worker.
+    """
+    worker_gate.set()
+    returned_values = []
+
+    def task_callback(data):
+        returned_values.append(data)
+
+    start_signal_spy = QSignalSpy(task_manager.sig_run_tasks_started)
+    end_signal_spy = QSignalSpy(task_manager.sig_run_tasks_finished)
+    completed_signal_spy = QSignalSpy(
+        task_manager.worker().sig_tasks_completed)
+
+    with task_manager.batch():
+        for i in range(3):
+            task_manager.add_task('set_something', None, i, i * 10)
+            task_manager.run_tasks()
+        with task_manager.batch():
+            task_manager.add_task('get_something', task_callback)
+            task_manager.run_tasks()
+
+        # The tasks are not run until the outermost context exits.
+        assert len(task_manager._queued_tasks) == 4
+        assert len(task_manager._running_tasks) == 0
+        assert len(start_signal_spy) == 0
+
+    assert len(task_manager._queued_tasks) == 0
+    assert len(task_manager._running_tasks) == 4
+
+    qtbot.waitUntil(lambda: len(end_signal_spy) == 1, timeout=5000)
+
+    assert returned_values == [[0, 10, 20, 4]]
+    assert len(start_signal_spy) == 1
+    assert len(completed_signal_spy) == 1
+
+
+def test_lifo_run_tasks(lifo_task_manager, worker_gate, qtbot, DATA):
     """
     Test that the LIFO tasks manager is working as expected.
     """
@@ -226,6 +315,7 @@ def test_lifo_run_tasks(lifo_task_manager, qtbot, DATA):
     assert len(lifo_task_manager._running_tasks) == 1
     assert lifo_task_manager._thread.isRunning()
 
+    worker_gate.set()
     qtbot.waitUntil(lambda: len(end_signal_spy) == 1, timeout=5000)
 
     assert len(lifo_task_manager._queued_tasks) == 0
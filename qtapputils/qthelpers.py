@@ -19,7 +19,6 @@ if TYPE_CHECKING:
 from contextlib import contextmanager
 import sys
 import platform
-import time
 from math import pi
 
 # ---- Third party imports
@@ -290,6 +289,10 @@ def format_statustip(text: str, shortcuts: list[str] | str):
     return stip
 
 
+_TOOLTIP_HEAD_TEMPLATE = "<p style='white-space:pre'><b>{}</b></p>"
+_TOOLTIP_TIP_TEMPLATE = "<p>{}</p>"
+
+
 def format_tooltip(text: str, tip: str, shortcuts: list[str] | str):
     """
     Format text, tip and shortcut into a single str to be set
@@ -301,19 +304,20 @@ def format_tooltip(text: str, tip: str, shortcuts: list[str] | str):
     # code to avoid problem with the HTML formatting of the tooltip.
     keystr = keystr.replace('<', '&#60;').replace('>', '&#62;')
 
-    ttip = ""
-    if text or keystr:
-        ttip += "<p style='white-space:pre'><b>"
-        if text:
-            ttip += f"{text}" + (" " if keystr else "")
-        if keystr:
-            ttip += "({sc_str})"
-        ttip += "</b></p>"
+    if text and keystr:
+        head = f"{text} ({keystr})"
+    elif keystr:
+        head = f"({keystr})"
+    else:
+        head = text
+
+    ttip = _TOOLTIP_HEAD_TEMPLATE.format(head) if head else ""
     if tip:
-        ttip += f"<p>{tip or ''}</p>"
+        ttip += _TOOLTIP_TIP_TEMPLATE.format(tip)
 
+    # The text and tip can refer to the shortcuts with '{sc_str}'.
     if keystr:
-        ttip = ttip.format(sc_str=keystr)
+        ttip = ttip.replace('{sc_str}', keystr)
 
     return ttip
 
@@ -329,18 +333,34 @@ def get_shortcuts_native_text(shortcuts: list[str] | str):
                       for sc in shortcuts])
 
 
+# A cache of the default contents margins of a QLayout, which are
+# resolved from the application style only once.
+_DEFAULT_CONTENTS_MARGINS: list[int] = []
+
+
 def get_default_contents_margins() -> list[int, int, int, int]:
     """
     Return the default [left, top, right, bottom] contents margins
     of a QLayout.
     """
-    style = QApplication.instance().style()
-    return [
-        style.pixelMetric(style.PM_LayoutLeftMargin),
-        style.pixelMetric(style.PM_LayoutTopMargin),
-        style.pixelMetric(style.PM_LayoutRightMargin),
-        style.pixelMetric(style.PM_LayoutBottomMargin),
-        ]
+    if not _DEFAULT_CONTENTS_MARGINS:
+        style = QApplication.instance().style()
+        _DEFAULT_CONTENTS_MARGINS.extend([
+            style.pixelMetric(style.PM_LayoutLeftMargin),
+            style.pixelMetric(style.PM_LayoutTopMargin),
+            style.pixelMetric(style.PM_LayoutRightMargin),
+            style.pixelMetric(style.PM_LayoutBottomMargin),
+            ])
+    # We return a copy, so that the cache cannot be modified by the caller.
+    return list(_DEFAULT_CONTENTS_MARGINS)
+
+
+def clear_contents_margins_cache():
+    """
+    Clear the cached default contents margins, so that they are resolved
+    again from the application style the next time they are requested.
+    """
+    _DEFAULT_CONTENTS_MARGINS.clear()
 
 
 @contextmanager
@@ -375,30 +395,35 @@ def qtwait(condition, timeout=None, check_interval=50, error_message=None):
     TimeoutError
         If the condition does not become True within the timeout.
     """
-    loop = QEventLoop()
-    start_time = time.monotonic()
+    # We return right away if the condition is already met, since quitting
+    # the event loop before it is executed has no effect.
+    if condition():
+        return
 
-    timed_out = [False]
-    # We use a mutable container for 'timed_out' so the inner check_condition()
-    # can update the value in the enclosing scope (works for nested functions
-    # without using the 'nonlocal' keyword).
+    loop = QEventLoop()
 
     def check_condition():
-        elapsed_time = time.monotonic() - start_time
         if condition():
             loop.quit()
-        elif timeout is not None and elapsed_time >= timeout:
-            timed_out[0] = True
-            loop.quit()
 
     timer = QTimer()
     timer.timeout.connect(check_condition)
     timer.start(check_interval)
 
-    check_condition()
-    loop.exec_()
+    # The timeout is handled with a single shot timer, so that the event
+    # loop is exited as soon as the timeout is reached instead of on the
+    # next check of the condition.
+    deadline = QTimer()
+    deadline.setSingleShot(True)
+    deadline.timeout.connect(lambda: loop.exit(1))
+    if timeout is not None:
+        deadline.start(int(timeout * 1000))
+
+    timed_out = loop.exec_() == 1
+    timer.stop()
+    deadline.stop()
 
     # Only raise TimeoutError if timeout was specified and reached.
-    if timeout is not None and timed_out[0] and not condition():
+    if timed_out and not condition():
         raise TimeoutError(
             error_message or "Condition not met within timeout.")
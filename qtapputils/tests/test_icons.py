@@ -13,15 +13,20 @@
 
 # ---- Standard imports
 from copy import deepcopy
+import gc
 import os.path as osp
 
 # ---- Third party imports
 import pytest
+from qtpy.QtCore import QSize
 from qtpy.QtGui import QImage, QIcon
 
 # ---- Local imports
 from qtapputils.colors import RED, YELLOW
-from qtapputils.icons import IconManager
+from qtapputils.icons import (
+    IconManager, clear_style_cache, _STANDARD_ICONSIZES)
+from qtapputils.qthelpers import (
+    get_default_contents_margins, _DEFAULT_CONTENTS_MARGINS)
 
 
 # =============================================================================
@@ -77,6 +82,66 @@ def test_get_qta_icons(qtbot, tmp_path):
     assert QImage(expected_home_img) == icon.pixmap(48).toImage()
 
 
+def test_get_icon_cache(qtbot):
+    """
+    Test that icons are cached by (name, color) and that clearing the
+    cache works as expected.
+    """
+    IM = IconManager(QTA_ICONS, LOCAL_ICONS)
+
+    icon = IM.get_icon('save')
+    assert IM.get_icon('save') is icon
+    assert IM.get_icon('save', color=YELLOW) is not icon
+    assert IM.get_icon('alert') is IM.get_icon('alert')
+    assert len(IM._icon_cache) == 3
+
+    # Local icons are shared regardless of the requested color.
+    assert IM.get_icon('alert', color=YELLOW) is IM.get_icon('alert')
+    assert len(IM._local_icon_cache) == 1
+
+    IM.clear_cache()
+    assert len(IM._icon_cache) == 0
+    assert len(IM._local_icon_cache) == 0
+
+    IM.get_icon('save')
+    assert len(IM._icon_cache) == 1
+
+
+def test_get_pixmap(qtbot):
+    """
+    Test that getting icon pixmaps from the QPixmapCache is working
+    as expected.
+    """
+    IM = IconManager(QTA_ICONS)
+
+    pixmap = IM.get_pixmap('save', 'small')
+    assert pixmap.size() == IM.get_iconsize('small')
+    assert len(IM._pixmap_keys) == 1
+    assert IM.get_pixmap('save', 'small').cacheKey() == pixmap.cacheKey()
+
+    IM.get_pixmap('save', 'large')
+    IM.get_pixmap('save', 'small', color=YELLOW)
+    assert len(IM._pixmap_keys) == 3
+
+    IM.clear_cache()
+    assert len(IM._pixmap_keys) == 0
+
+
+def test_get_pixmap_new_manager(qtbot):
+    """
+    Test that a new icon manager does not get the pixmaps cached by
+    managers that were deleted, even if they share the same icon names.
+    """
+    qta_names = ['mdi.home', 'mdi.content-save']
+    for i in range(10):
+        IM = IconManager({'save': [(qta_names[i % 2],)]})
+        pixmap = IM.get_pixmap('save', 'small')
+        expected_pixmap = IM.get_icon('save').pixmap(IM.get_iconsize('small'))
+        assert pixmap.toImage() == expected_pixmap.toImage()
+        del IM
+        gc.collect()
+
+
 def test_get_local_icons(qtbot, tmp_path):
     """
     Test that getting local icons is working as expected.
@@ -88,6 +153,21 @@ def test_get_local_icons(qtbot, tmp_path):
     assert QImage(expected_home_img) == icon.pixmap(48).toImage()
 
 
+def test_get_iconsize(qtbot):
+    """
+    Test that modifying the QSize returned by get_iconsize does not
+    modify the icon sizes of the manager.
+    """
+    IM = IconManager(QTA_ICONS)
+
+    size = IM.get_iconsize('small')
+    assert size == QSize(20, 20)
+
+    size *= 2
+    size.setWidth(10)
+    assert IM.get_iconsize('small') == QSize(20, 20)
+
+
 def test_get_standard_icon(qtbot):
     """
     Test that getting standard icon is working as expected.
@@ -103,6 +183,16 @@ def test_get_standard_iconsize(qtbot):
     IM = IconManager()
     for constant in ['messagebox', 'small']:
         assert isinstance(IM.get_standard_iconsize(constant), int)
+    assert IM.get_standard_iconsize('unknown') is None
+
+    # Test that the standard icon sizes are cached.
+    assert set(_STANDARD_ICONSIZES) >= {'messagebox', 'small'}
+    get_default_contents_margins()
+    assert len(_DEFAULT_CONTENTS_MARGINS) == 4
+
+    clear_style_cache()
+    assert len(_STANDARD_ICONSIZES) == 0
+    assert len(_DEFAULT_CONTENTS_MARGINS) == 0
 
 
 def test_default_icon_color():
@@ -11,6 +11,7 @@
 
 # ---- Standard imports
 from math import pi
+import time
 from itertools import product
 
 # ---- Third party imports
@@ -22,7 +23,8 @@ import pytest
 # ---- Local imports
 from qtapputils.qthelpers import (
     format_tooltip, create_waitspinner, qtwait, get_qcolor,
-    set_widget_palette)
+    set_widget_palette, get_default_contents_margins,
+    clear_contents_margins_cache)
 
 
 # =============================================================================
@@ -38,37 +40,54 @@ def spinner(qtbot):
 # =============================================================================
 # ---- Tests
 # =============================================================================
-def test_format_tooltip():
+def _expected_tooltip(text, shortcut, tip):
+    """Return the tooltip expected from 'format_tooltip'."""
+    keystr = 'S' if shortcut == 'S' else ''
+    if text and keystr and tip:
+        return ("<p style='white-space:pre'><b>TEXT (S)</b></p>"
+                "<p>TOOLTIPTEXT</p>")
+    elif text and keystr:
+        return "<p style='white-space:pre'><b>TEXT (S)</b></p>"
+    elif text and tip:
+        return ("<p style='white-space:pre'><b>TEXT</b></p>"
+                "<p>TOOLTIPTEXT</p>")
+    elif keystr and tip:
+        return ("<p style='white-space:pre'><b>(S)</b></p>"
+                "<p>TOOLTIPTEXT</p>")
+    elif text:
+        return "<p style='white-space:pre'><b>TEXT</b></p>"
+    elif keystr:
+        return "<p style='white-space:pre'><b>(S)</b></p>"
+    elif tip:
+        return "<p>TOOLTIPTEXT</p>"
+    else:
+        return ""
+
+
+FORMAT_TOOLTIP_CASES = [
+    (text, shortcut, tip, _expected_tooltip(text, shortcut, tip)) for
+    text, shortcut, tip in product(
+        ['TEXT', None, ''],
+        ['S', None, '', 'BADSHORTCUT'],
+        ['TOOLTIPTEXT', None, ''])
+    ]
+
+
+@pytest.mark.parametrize("text,shortcut,tip,expected", FORMAT_TOOLTIP_CASES)
+def test_format_tooltip(text, shortcut, tip, expected):
     """Test that tooltip are formatted correctly."""
-    texts = ['TEXT', None, '']
-    shortcuts = ['S', None, '', 'BADSHORTCUT']
-    tips = ['TOOLTIPTEXT', None, '']
-    for text, shortcut, tip in product(texts, shortcuts, tips):
-        keystr = 'S' if shortcut == 'S' else ''
-        if text and keystr and tip:
-            expected_ttip = ("<p style='white-space:pre'><b>TEXT (S)</b></p>"
-                             "<p>TOOLTIPTEXT</p>")
-        elif text and keystr:
-            expected_ttip = "<p style='white-space:pre'><b>TEXT (S)</b></p>"
-        elif text and tip:
-            expected_ttip = ("<p style='white-space:pre'><b>TEXT</b></p>"
-                             "<p>TOOLTIPTEXT</p>")
-        elif keystr and tip:
-            expected_ttip = ("<p style='white-space:pre'><b>(S)</b></p>"
-                             "<p>TOOLTIPTEXT</p>")
-        elif text:
-            expected_ttip = "<p style='white-space:pre'><b>TEXT</b></p>"
-        elif keystr:
-            expected_ttip = "<p style='white-space:pre'><b>(S)</b></p>"
-        elif tip:
-            expected_ttip = "<p>TOOLTIPTEXT</p>"
-        else:
-            expected_ttip = ""
-
-        tooltip = format_tooltip(text=text, shortcuts=shortcut, tip=tip)
-        assertion_error = {'text': text, 'shortcut': shortcut, 'tip': tip}
-
-        assert tooltip == expected_ttip, assertion_error
+    assert format_tooltip(text=text, shortcuts=shortcut, tip=tip) == expected
+
+
+def test_format_tooltip_braces():
+    """
+    Test that '{sc_str}' is replaced by the shortcuts in the tip and that
+    other braces are kept as is.
+    """
+    assert format_tooltip(
+        text='{TEXT}', shortcuts='S', tip='{TIP} with {sc_str}') == (
+        "<p style='white-space:pre'><b>{TEXT} (S)</b></p>"
+        "<p>{TIP} with S</p>")
 
 
 def test_create_waitspinner(spinner, qtbot):
@@ -93,15 +112,13 @@ def test_create_waitspinner(spinner, qtbot):
 
     # Start the spinner.
     spinner.start()
-    qtbot.wait(100)
+    qtbot.waitUntil(lambda: spinner._currentCounter > 0, timeout=1000)
 
     assert spinner.isVisible() is True
     assert spinner.isSpinning() is True
-    assert spinner._currentCounter > 0
 
     # Stop the spinner.
     spinner.stop()
-    qtbot.wait(100)
 
     assert spinner.isVisible() is False
     assert spinner.isSpinning() is False
@@ -114,18 +131,19 @@ def test_qtwait_success(qtbot):
     True before timeout.
 
     This test simulates an asynchronous change: a variable is set to True
-    after 200 ms via a singleShot QTimer. We then call qtwait with a timeout
-    of 1 second and expect it to finish without raising any exception.
+    via a singleShot QTimer once control returns to the event loop. We then
+    call qtwait with a timeout of 1 second and expect it to finish without
+    raising any exception.
     """
     state = {'ready': False}
 
     def set_ready():
         state['ready'] = True
 
-    QTimer.singleShot(200, set_ready)
+    QTimer.singleShot(0, set_ready)
 
     assert state['ready'] is False
-    qtwait(lambda: state['ready'], timeout=1)
+    qtwait(lambda: state['ready'], timeout=1, check_interval=10)
     assert state['ready'] is True
 
 
@@ -144,6 +162,38 @@ def test_qtwait_timeout(qtbot):
     assert "Timeout reached!" in str(excinfo.value)
 
 
+def test_qtwait_latency(qtbot):
+    """
+    Test that qtwait does not wait for the next check of the condition
+    when the condition is already met or when the timeout is reached.
+    """
+    start_time = time.monotonic()
+    qtwait(lambda: True, timeout=1, check_interval=1000)
+    assert time.monotonic() - start_time < 0.5
+
+    start_time = time.monotonic()
+    with pytest.raises(TimeoutError):
+        qtwait(lambda: False, timeout=0.1, check_interval=1000)
+    assert time.monotonic() - start_time < 0.5
+
+
+def test_get_default_contents_margins(qtbot):
+    """
+    Test that the default contents margins are cached and that the
+    cached values cannot be modified by the caller.
+    """
+    margins = get_default_contents_margins()
+    assert len(margins) == 4
+    assert all(isinstance(margin, int) for margin in margins)
+
+    expected_margins = list(margins)
+    margins[0] = -1
+    assert get_default_contents_margins() == expected_margins
+
+    clear_contents_margins_cache()
+    assert get_default_contents_margins() == expected_margins
+
+
 def test_get_qcolor():
     """
     Test that get_qcolor correctly creates a QColor from various
@@ -11,7 +11,7 @@ from typing import Callable
 
 
 # ---- Third party imports
-from qtpy.QtCore import Qt, QSize
+from qtpy.QtCore import Qt, QSize, QTimer
 from qtpy.QtGui import QIcon
 from qtpy.QtWidgets import (
     QApplication, QDialog, QDialogButtonBox, QPushButton,
@@ -23,6 +23,19 @@ from qtapputils.qthelpers import get_default_contents_margins
 from qtapputils.widgets.statusbar import ProcessStatusBar
 
 
+class LabelBrowser(QTextBrowser):
+    """A QTextBrowser that is sized like a QLabel."""
+
+    def text(self):
+        return self.toPlainText()
+
+    def minimumSizeHint(self):
+        return QLabel().minimumSizeHint()
+
+    def sizeHint(self):
+        return QLabel().sizeHint()
+
+
 class UserMessage(QWidget):
 
     def __init__(self, parent=None,
@@ -32,15 +45,6 @@ class UserMessage(QWidget):
         self._iconsize = iconsize
 
         # Setup the container for the text.
-        class LabelBrowser(QTextBrowser):
-            def text(self):
-                return self.toPlainText()
-
-            def minimumSizeHint(self):
-                return QLabel().minimumSizeHint()
-
-            def sizeHint(self):
-                return QLabel().sizeHint()
         self._label = LabelBrowser()
         self._label.setLineWrapMode(LabelBrowser.WidgetWidth)
         self._label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
@@ -187,20 +191,30 @@ class UserMessageDialogBase(QDialog):
             self, dialog: ProcessStatusBar, message: str, beep: bool = True):
         """Show to the user the specified dialog with the provided message."""
         self.show()
+        # We disable the updates of the button box while changing the
+        # visibility of the buttons, so that it is repainted only once.
+        dialog_buttons = set(dialog._buttons)
+        self.button_box.setUpdatesEnabled(False)
         for btn in self._buttons:
-            btn.setVisible(btn in dialog._buttons)
+            btn.setVisible(btn in dialog_buttons)
+        self.button_box.setUpdatesEnabled(True)
         dialog.set_text(message)
         self.stackwidget.setCurrentWidget(dialog)
         if beep is True:
-            QApplication.beep()
+            # We beep once control returns to the event loop, so that
+            # the dialog is not delayed by the system sound.
+            QTimer.singleShot(0, QApplication.beep)
 
     def close_message_dialogs(self):
         """Close all message dialogs and show the main interface."""
+        # We collect the buttons of the dialogs in a set, so that the
+        # visibility of each button is set only once.
+        dialog_buttons = {
+            btn for dialog in self._dialogs for btn in dialog._buttons}
+        self.button_box.setUpdatesEnabled(False)
         for btn in self._buttons:
-            btn.setVisible(True)
-        for dialog in self._dialogs:
-            for btn in dialog._buttons:
-                btn.setVisible(False)
+            btn.setVisible(btn not in dialog_buttons)
+        self.button_box.setUpdatesEnabled(True)
         self.stackwidget.setCurrentWidget(self.central_widget)
 
     def show(self):
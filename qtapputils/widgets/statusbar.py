@@ -9,15 +9,40 @@
 
 # ---- Third party imports
 from qtpy.QtCore import QSize, Qt
-from qtpy.QtGui import QIcon
+from qtpy.QtGui import QIcon, QPixmap, QPixmapCache
 from qtpy.QtWidgets import QGridLayout, QLabel, QWidget
-import qtawesome as qta
 
 # ---- Local imports
 from qtapputils.qthelpers import create_waitspinner
 from qtapputils.colors import RED, GREEN, BLUE
 
 
+VALIGN_DICT = {
+    'center': Qt.AlignVCenter,
+    'top': Qt.AlignTop,
+    'bottom': Qt.AlignBottom
+    }
+
+
+def get_status_pixmap(qta_name: str, color: str, size: int) -> QPixmap:
+    """
+    Return a pixmap of the qtawesome icon 'qta_name' rendered at the
+    specified size and color.
+
+    Rendered pixmaps are stored in the QPixmapCache, so that they are
+    shared by all status bars instead of being rasterized for each one.
+    """
+    key = f"qtapputils|statusbar|{qta_name}|{color}|{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        # We import qtawesome here to avoid the cost of loading its
+        # icon fonts when no status icon is shown.
+        import qtawesome as qta
+        pixmap = qta.icon(qta_name, color=color).pixmap(QSize(size, size))
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 class ProcessStatusBar(QWidget):
     """
     A status bar that shows the progression status and results of a process.
@@ -31,6 +56,13 @@ class ProcessStatusBar(QWidget):
     PROCESS_FAILED = 3
     NEED_UPDATE = 4
 
+    # The qtawesome names and colors of the default status icons.
+    STATUS_ICONS = {
+        'failed': ('mdi.alert-circle-outline', RED),
+        'success': ('mdi.check-circle-outline', GREEN),
+        'update': ('mdi.update', BLUE),
+        }
+
     def __init__(self, parent=None, iconsize=24, ndots=11,
                  orientation=Qt.Horizontal, spacing: int = 5,
                  contents_margin: list = None,
@@ -73,12 +105,6 @@ class ProcessStatusBar(QWidget):
         self._status = self.HIDDEN
         self._iconsize = iconsize
 
-        VALIGN_DICT = {
-            'center': Qt.AlignVCenter,
-            'top': Qt.AlignTop,
-            'bottom': Qt.AlignBottom
-            }
-
         text_valign = VALIGN_DICT[text_valign]
         self._label = QLabel()
         if orientation == Qt.Horizontal:
@@ -95,21 +121,15 @@ class ProcessStatusBar(QWidget):
 
         self._spinner = create_waitspinner(iconsize, ndots, self)
 
-        # Setup status icons.
-        self._icons = {
-            'failed': QLabel(),
-            'success': QLabel(),
-            'update': QLabel()
-            }
+        # Setup status icons. A single label is used to show the pixmap of
+        # the current status icon. The default icons are only rendered when
+        # they are shown for the first time, since many status bars only
+        # ever show the spinner.
+        self._icon_label = QLabel()
+        self._icon_pixmaps: dict[str, QPixmap] = {}
+        self._current_icon = None
         self.hide_icons()
 
-        self.set_icon(
-            'failed', qta.icon('mdi.alert-circle-outline', color=RED))
-        self.set_icon(
-            'success', qta.icon('mdi.check-circle-outline', color=GREEN))
-        self.set_icon(
-            'update', qta.icon('mdi.update', color=BLUE))
-
         # Setup layout.
         layout = QGridLayout(self)
         if contents_margin is None:
@@ -122,8 +142,7 @@ class ProcessStatusBar(QWidget):
         else:
             alignment = Qt.AlignCenter | icon_valign
         layout.addWidget(self._spinner, 1, 1, alignment)
-        for icon in self._icons.values():
-            layout.addWidget(icon, 1, 1, alignment)
+        layout.addWidget(self._icon_label, 1, 1, alignment)
 
         if orientation == Qt.Horizontal:
             layout.addWidget(self._label, 1, 2)
@@ -157,22 +176,25 @@ class ProcessStatusBar(QWidget):
         """Show icon named 'icon_name' and hide all other icons."""
         self._spinner.hide()
         self._spinner.stop()
-        for name, icon in self._icons.items():
-            if name == icon_name:
-                icon.show()
-            else:
-                icon.hide()
+        pixmap = self._icon_pixmaps.get(icon_name)
+        if pixmap is None:
+            pixmap = self._icon_pixmaps[icon_name] = get_status_pixmap(
+                *self.STATUS_ICONS[icon_name], self._iconsize)
+        self._current_icon = icon_name
+        self._icon_label.setPixmap(pixmap)
+        self._icon_label.show()
 
     def hide_icons(self):
         """Hide all icons."""
-        for icon in self._icons.values():
-            icon.hide()
+        self._current_icon = None
+        self._icon_label.hide()
 
     def set_icon(self, name: str, icon: QIcon):
         """Set the icon named 'name'."""
-        self._icons[name].setPixmap(
-            icon.pixmap(QSize(self._iconsize, self._iconsize))
-            )
+        pixmap = icon.pixmap(QSize(self._iconsize, self._iconsize))
+        self._icon_pixmaps[name] = pixmap
+        if name == self._current_icon:
+            self._icon_label.setPixmap(pixmap)
 
     @property
     def status(self):
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright © QtAppUtils Project Contributors
+# https://github.com/jnsebgosselin/qtapputils
+#
+# This file is part of QtAppUtils.
+# Licensed under the terms of the MIT License.
+# -----------------------------------------------------------------------------
+
+"""
+Tests for the dialogs.py module.
+"""
+
+# ---- Standard imports
+from unittest.mock import patch
+
+# ---- Third party imports
+from qtpy.QtWidgets import QApplication
+import pytest
+
+# ---- Local imports
+from qtapputils.widgets.dialogs import UserMessage, UserMessageDialogBase
+
+
+# =============================================================================
+# ---- Fixtures
+# =============================================================================
+@pytest.fixture
+def msgdialog(qtbot):
+    msgdialog = UserMessageDialogBase()
+    qtbot.addWidget(msgdialog)
+
+    msgdialog.main_button = msgdialog.create_button('Main')
+    msgdialog.add_button(msgdialog.main_button)
+
+    msgdialog.warning_buttons = [
+        msgdialog.create_button('Ok'), msgdialog.create_button('Cancel')]
+    msgdialog.warning_dialog = msgdialog.create_msg_dialog(
+        'SP_MessageBoxWarning', msgdialog.warning_buttons)
+    msgdialog.add_msg_dialog(msgdialog.warning_dialog)
+
+    msgdialog.error_buttons = [msgdialog.create_button('Close')]
+    msgdialog.error_dialog = msgdialog.create_msg_dialog(
+        'SP_MessageBoxCritical', msgdialog.error_buttons)
+    msgdialog.add_msg_dialog(msgdialog.error_dialog)
+
+    msgdialog.show()
+    assert msgdialog.main_button.isVisible()
+    for btn in msgdialog.warning_buttons + msgdialog.error_buttons:
+        assert not btn.isVisible()
+
+    return msgdialog
+
+
+# =============================================================================
+# ---- Tests for the UserMessageDialogBase
+# =============================================================================
+def test_show_close_message_dialogs(msgdialog, qtbot):
+    """
+    Test that only the buttons of the dialog that is shown are visible.
+    """
+    # Show the warning dialog.
+    msgdialog.show_message_dialog(
+        msgdialog.warning_dialog, 'test warning', beep=False)
+    assert msgdialog.stackwidget.currentWidget() == msgdialog.warning_dialog
+    assert msgdialog.warning_dialog._label.text() == 'test warning'
+    assert not msgdialog.main_button.isVisible()
+    for btn in msgdialog.warning_buttons:
+        assert btn.isVisible()
+    for btn in msgdialog.error_buttons:
+        assert not btn.isVisible()
+
+    # Show the error dialog.
+    msgdialog.show_message_dialog(
+        msgdialog.error_dialog, 'test error', beep=False)
+    assert msgdialog.stackwidget.currentWidget() == msgdialog.error_dialog
+    assert not msgdialog.main_button.isVisible()
+    for btn in msgdialog.warning_buttons:
+        assert not btn.isVisible()
+    for btn in msgdialog.error_buttons:
+        assert btn.isVisible()
+
+    # Show a dialog with a beep, which is done asynchronously.
+    with patch.object(QApplication, 'beep') as mock_beep:
+        msgdialog.show_message_dialog(msgdialog.error_dialog, 'test beep')
+        assert mock_beep.call_count == 0
+        qtbot.waitUntil(lambda: mock_beep.call_count == 1)
+
+    # Close the message dialogs.
+    msgdialog.close_message_dialogs()
+    assert msgdialog.stackwidget.currentWidget() == msgdialog.central_widget
+    assert msgdialog.main_button.isVisible()
+    for btn in msgdialog.warning_buttons + msgdialog.error_buttons:
+        assert not btn.isVisible()
+
+
+def test_add_button_to_msg_dialog(msgdialog, qtbot):
+    """
+    Test that buttons added to a message dialog after it was added to
+    the dialog window are handled as expected.
+    """
+    extra_button = msgdialog.create_button('Retry')
+    msgdialog.error_dialog._buttons.append(extra_button)
+    msgdialog.add_button(extra_button)
+
+    msgdialog.show_message_dialog(
+        msgdialog.error_dialog, 'test error', beep=False)
+    assert extra_button.isVisible()
+
+    msgdialog.show_message_dialog(
+        msgdialog.warning_dialog, 'test warning', beep=False)
+    assert not extra_button.isVisible()
+
+    msgdialog.close_message_dialogs()
+    assert msgdialog.main_button.isVisible()
+    assert not extra_button.isVisible()
+
+
+def test_show_custom_msg_dialog(msgdialog, qtbot):
+    """
+    Test showing a message dialog that was not created with
+    'create_msg_dialog'.
+    """
+    dialog = UserMessage()
+    dialog._buttons = [msgdialog.create_button('Yes')]
+    msgdialog.add_msg_dialog(dialog)
+
+    msgdialog.show_message_dialog(dialog, 'test custom', beep=False)
+    assert msgdialog.stackwidget.currentWidget() == dialog
+    assert dialog._buttons[0].isVisible()
+    assert not msgdialog.main_button.isVisible()
+
+
+if __name__ == "__main__":
+    pytest.main(['-x', __file__, '-v', '-rw'])
@@ -12,7 +12,9 @@ Tests for the statusbar.py module.
 """
 
 # ---- Third party imports
+from qtpy.QtCore import QSize
 import pytest
+import qtawesome as qta
 
 # ---- Local imports
 from qtapputils.widgets.statusbar import ProcessStatusBar
@@ -31,8 +33,7 @@ def pstatusbar(qtbot):
     assert pstatusbar.status == pstatusbar.HIDDEN
     assert not pstatusbar._spinner._isSpinning
     assert not pstatusbar._spinner.isVisible()
-    for icon in pstatusbar._icons.values():
-        assert not icon.isVisible()
+    assert not pstatusbar._icon_label.isVisible()
     assert pstatusbar._label.text() == ''
 
     return pstatusbar
@@ -49,16 +50,14 @@ def test_pstatusbar_showhide(pstatusbar):
     assert pstatusbar.status == pstatusbar.IN_PROGRESS
     assert pstatusbar._spinner._isSpinning
     assert pstatusbar._spinner.isVisible()
-    for icon in pstatusbar._icons.values():
-        assert not icon.isVisible()
+    assert not pstatusbar._icon_label.isVisible()
     assert pstatusbar._label.text() == 'test in progess'
 
     # Hide the progress status bar.
     pstatusbar.hide()
     assert not pstatusbar._spinner._isSpinning
     assert not pstatusbar._spinner.isVisible()
-    for icon in pstatusbar._icons.values():
-        assert not icon.isVisible()
+    assert not pstatusbar._icon_label.isVisible()
 
 
 def test_pstatusbar_fail_success_update(pstatusbar):
@@ -71,17 +70,19 @@ def test_pstatusbar_fail_success_update(pstatusbar):
     assert pstatusbar._spinner._isSpinning
     assert pstatusbar._spinner.isVisible()
     assert pstatusbar._label.text() == 'test is spinning'
-    for icon in pstatusbar._icons.values():
-        assert not icon.isVisible()
+    assert not pstatusbar._icon_label.isVisible()
+
+    # The icons are not rendered until they are shown.
+    assert pstatusbar._icon_pixmaps == {}
 
     # Show the failed icon and message.
     pstatusbar.show_fail_icon('test fail icon')
+    assert list(pstatusbar._icon_pixmaps) == ['failed']
     assert pstatusbar.status == pstatusbar.PROCESS_FAILED
     assert not pstatusbar._spinner._isSpinning
     assert not pstatusbar._spinner.isVisible()
-    assert pstatusbar._icons['failed'].isVisible()
-    assert not pstatusbar._icons['success'].isVisible()
-    assert not pstatusbar._icons['update'].isVisible()
+    assert pstatusbar._icon_label.isVisible()
+    assert pstatusbar._current_icon == 'failed'
     assert pstatusbar._label.text() == 'test fail icon'
 
     # Show the progress status bar again.
@@ -89,17 +90,15 @@ def test_pstatusbar_fail_success_update(pstatusbar):
     assert pstatusbar._spinner._isSpinning
     assert pstatusbar._spinner.isVisible()
     assert pstatusbar._label.text() == 'test is spinning'
-    for icon in pstatusbar._icons.values():
-        assert not icon.isVisible()
+    assert not pstatusbar._icon_label.isVisible()
 
     # Show the success icon and message.
     pstatusbar.show_sucess_icon('test success icon')
     assert pstatusbar.status == pstatusbar.PROCESS_SUCCEEDED
     assert not pstatusbar._spinner._isSpinning
     assert not pstatusbar._spinner.isVisible()
-    assert not pstatusbar._icons['failed'].isVisible()
-    assert pstatusbar._icons['success'].isVisible()
-    assert not pstatusbar._icons['update'].isVisible()
+    assert pstatusbar._icon_label.isVisible()
+    assert pstatusbar._current_icon == 'success'
     assert pstatusbar._label.text() == 'test success icon'
 
     # Show the progress status bar again.
@@ -107,19 +106,54 @@ def test_pstatusbar_fail_success_update(pstatusbar):
     assert pstatusbar._spinner._isSpinning
     assert pstatusbar._spinner.isVisible()
     assert pstatusbar._label.text() == 'test is spinning'
-    for icon in pstatusbar._icons.values():
-        assert not icon.isVisible()
+    assert not pstatusbar._icon_label.isVisible()
 
     # Show the update icon and message.
     pstatusbar.show_update_icon('test update icon')
     assert pstatusbar.status == pstatusbar.NEED_UPDATE
     assert not pstatusbar._spinner._isSpinning
     assert not pstatusbar._spinner.isVisible()
-    assert not pstatusbar._icons['failed'].isVisible()
-    assert not pstatusbar._icons['success'].isVisible()
-    assert pstatusbar._icons['update'].isVisible()
+    assert pstatusbar._icon_label.isVisible()
+    assert pstatusbar._current_icon == 'update'
     assert pstatusbar._label.text() == 'test update icon'
 
 
+def test_pstatusbar_shared_pixmaps(pstatusbar, qtbot):
+    """
+    Test that the pixmaps of the status icons are shared between the
+    process status bars.
+    """
+    pstatusbar2 = ProcessStatusBar()
+    qtbot.addWidget(pstatusbar2)
+
+    pstatusbar.show_sucess_icon()
+    pstatusbar2.show_sucess_icon()
+
+    pixmap = pstatusbar._icon_label.pixmap()
+    pixmap2 = pstatusbar2._icon_label.pixmap()
+    assert pixmap.cacheKey() == pixmap2.cacheKey()
+    assert pixmap.size() == QSize(24, 24)
+
+
+def test_pstatusbar_set_icon(pstatusbar):
+    """Test that setting a custom status icon is working as expected."""
+    pstatusbar.show_fail_icon()
+    default_key = pstatusbar._icon_label.pixmap().cacheKey()
+
+    # Setting the icon that is currently shown updates it right away.
+    pstatusbar.set_icon('failed', qta.icon('mdi.close', color='red'))
+    custom_key = pstatusbar._icon_pixmaps['failed'].cacheKey()
+    assert custom_key != default_key
+    assert pstatusbar._icon_label.pixmap().cacheKey() == custom_key
+
+    # Setting another icon does not change the icon that is shown.
+    pstatusbar.set_icon('success', qta.icon('mdi.check', color='green'))
+    assert pstatusbar._icon_label.pixmap().cacheKey() == custom_key
+
+    pstatusbar.show_sucess_icon()
+    assert pstatusbar._icon_label.pixmap().cacheKey() == (
+        pstatusbar._icon_pixmaps['success'].cacheKey())
+
+
 if __name__ == "__main__":
     pytest.main(['-x', __file__, '-v', '-rw'])